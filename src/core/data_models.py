@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 class TransformationType(Enum):
@@ -45,6 +45,7 @@ class Transformation:
     inputs: List[Item]
     outputs: List[Item]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _signature: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate and deduplicate transformation data."""
@@ -66,10 +67,15 @@ class Transformation:
         """
         Get a hashable signature for this transformation for deduplication.
 
+        The signature is computed once and cached on the instance, so transformations
+        should not be modified after their signature has been requested.
+
         Returns:
             Tuple containing transformation type, sorted input names, sorted output names, and metadata
         """
-        input_names = tuple(sorted(item.name for item in self.inputs))
-        output_names = tuple(sorted(item.name for item in self.outputs))
-        metadata_tuple = tuple(sorted(self.metadata.items()))
-        return (self.transformation_type, input_names, output_names, metadata_tuple)
+        if self._signature is None:
+            input_names = tuple(sorted(item.name for item in self.inputs))
+            output_names = tuple(sorted(item.name for item in self.outputs))
+            metadata_tuple = tuple(sorted(self.metadata.items()))
+            self._signature = (self.transformation_type, input_names, output_names, metadata_tuple)
+        return self._signature
@@ -2,7 +2,7 @@
 
 # Education Edition chemistry items and special content
 # These items should not appear in Java Edition transformation data
-EDUCATION_EDITION_ITEMS = {
+EDUCATION_EDITION_ITEMS = frozenset({
     # Chlorides
     "Cerium Chloride",
     "Mercuric Chloride",
@@ -159,11 +159,11 @@ EDUCATION_EDITION_ITEMS = {
     "Border",
     "Camera",
     "NPC",
-}
+})
 
 # Items that should NOT be blacklisted (Java Edition items with similar names)
 # This is a safety list to prevent false positives
-JAVA_EDITION_ITEMS_TO_KEEP = {
+JAVA_EDITION_ITEMS_TO_KEEP = frozenset({
     "Copper Ingot",
     "Copper Block",
     "Copper Ore",
@@ -173,7 +173,10 @@ JAVA_EDITION_ITEMS_TO_KEEP = {
     "Ice",
     "Packed Ice",
     "Blue Ice",
-}
+})
+
+# Items actually filtered out, precomputed so each lookup is a single hash check
+EDUCATION_EDITION_ONLY_ITEMS = EDUCATION_EDITION_ITEMS - JAVA_EDITION_ITEMS_TO_KEEP
 
 
 def is_education_edition_item(item_name: str) -> bool:
@@ -186,9 +189,5 @@ def is_education_edition_item(item_name: str) -> bool:
     Returns:
         True if the item is Education Edition only, False otherwise
     """
-    # First check if it's explicitly a Java Edition item
-    if item_name in JAVA_EDITION_ITEMS_TO_KEEP:
-        return False
-
-    # Then check against blacklist
-    return item_name in EDUCATION_EDITION_ITEMS
+    # Blacklist minus the explicit Java Edition items to keep
+    return item_name in EDUCATION_EDITION_ONLY_ITEMS
@@ -0,0 +1,46 @@
+"""Decoding of the JSON-encoded cells of the transformations CSV."""
+
+from json import JSONDecoder
+from typing import Any
+
+# Use orjson for faster JSON decoding when available
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+# raw_decode() skips the input checks of json.loads(), which dominate the
+# cost of the small documents found in CSV cells
+_raw_decode = JSONDecoder().raw_decode
+
+
+def decode_json_cell(cell: str, expected_type: type) -> Any:
+    """
+    Decode a single JSON cell of the transformations CSV.
+
+    The cell must hold exactly one JSON value of the expected type, so a cell
+    carrying a partial or extra value is rejected rather than decoded into
+    something that looks valid.
+
+    Args:
+        cell: JSON document stored in the cell
+        expected_type: Type of the decoded value (list for item columns,
+            dict for metadata)
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the cell is not exactly one JSON value of expected_type
+    """
+    if _orjson_loads is not None:
+        value = _orjson_loads(cell)
+    else:
+        cell = cell.strip()
+        value, end = _raw_decode(cell)
+        if end != len(cell):
+            raise ValueError(f"Extra data after JSON value: {cell!r}")
+
+    if not isinstance(value, expected_type):
+        raise ValueError(f"Expected a JSON {expected_type.__name__}: {cell!r}")
+    return value
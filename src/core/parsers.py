@@ -1,8 +1,9 @@
 """HTML parsers for extracting Minecraft transformation data."""
 
 import re
-from typing import List, Optional
-from bs4 import BeautifulSoup, Tag
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from .data_models import Item, Transformation, TransformationType
 from .education_edition_blacklist import is_education_edition_item
 
@@ -10,6 +11,52 @@ from .education_edition_blacklist import is_education_edition_item
 # Excluded sections for crafting parser (historical/obsolete recipes)
 EXCLUDED_CRAFTING_SECTIONS = {"Removed_recipes", "Changed_recipes"}
 
+# Edition names that can appear in inline "[... only]" markers
+EDITION_NAME_PATTERN = re.compile(r"bedrock|education")
+
+# Words any inline edition marker next to an item link must contain (BE = Bedrock Edition)
+INLINE_MARKER_HINT_PATTERN = re.compile(r"bedrock|education|only")
+
+# Restrict parsing of full wiki pages to the article body (skips navigation, sidebars, footer)
+ARTICLE_CONTENT_ID = "mw-content-text"
+ARTICLE_CONTENT_STRAINER = SoupStrainer(id=ARTICLE_CONTENT_ID)
+
+# Prebuilt filters for the per-slot lookups; passing these to find()/find_all()
+# avoids rebuilding the match rules on every call
+WIKI_LINK_FILTER = SoupStrainer("a", href=re.compile(r"^/w/"))
+MW_HEADLINE_FILTER = SoupStrainer("span", class_="mw-headline")
+CRAFTING_TABLE_UI_FILTER = SoupStrainer("span", class_=re.compile(r"mcui.*Crafting.*Table"))
+MCUI_INPUT_FILTER = SoupStrainer("span", class_="mcui-input")
+MCUI_OUTPUT_FILTER = SoupStrainer("span", class_="mcui-output")
+INVSLOT_FILTER = SoupStrainer("span", class_="invslot")
+INVSLOT_ITEM_FILTER = SoupStrainer("span", class_="invslot-item")
+
+
+def parse_article_content(html_content: Union[str, bytes]) -> BeautifulSoup:
+    """
+    Parse only the article body of a wiki page, falling back to a full parse.
+
+    The article body keeps the table rows, sections and headings that the edition
+    and section filters inspect, so recipe context is preserved.
+
+    Args:
+        html_content: HTML content from a wiki page or an HTML fragment (str or raw bytes)
+
+    Returns:
+        BeautifulSoup tree of the article body, or of the whole document if no body is found
+    """
+    # Fragments (e.g. test fixtures) have no article wrapper; a substring check
+    # is far cheaper than a strained parse that comes back empty
+    marker = ARTICLE_CONTENT_ID.encode() if isinstance(html_content, bytes) else ARTICLE_CONTENT_ID
+    if marker not in html_content:
+        return BeautifulSoup(html_content, "lxml")
+
+    soup = BeautifulSoup(html_content, "lxml", parse_only=ARTICLE_CONTENT_STRAINER)
+    if soup.find(True) is None:
+        # The id was only mentioned (e.g. in a script), not used on an element
+        soup = BeautifulSoup(html_content, "lxml")
+    return soup
+
 
 def is_java_edition(element: Tag) -> bool:
     """
@@ -49,6 +96,10 @@ def is_java_edition(element: Tag) -> bool:
                ("education" in cell_text or "minecraft education" in cell_text):
                 return False
 
+            # Marker text is part of the cell text: skip the <sup> scan when no marker can match
+            if "only" not in cell_text or not EDITION_NAME_PATTERN.search(cell_text):
+                continue
+
             # Check for inline edition markers (sup with Inline-Template class)
             # Pattern: <sup class="nowrap Inline-Template">...[Bedrock Edition and Minecraft Education only]</sup>
             sup_markers = cell.find_all("sup", class_="Inline-Template")
@@ -60,6 +111,24 @@ def is_java_edition(element: Tag) -> bool:
     return True
 
 
+def iter_previous_headings(element: Tag) -> Iterator[Tag]:
+    """
+    Lazily yield previous sibling <h2>/<h3> headings, nearest first.
+
+    Unlike find_previous_siblings(), this stops walking as soon as the caller
+    has found the heading it needs instead of collecting every earlier sibling.
+
+    Args:
+        element: BeautifulSoup Tag whose previous siblings are scanned
+
+    Yields:
+        Heading Tags preceding the element at the same DOM level
+    """
+    for sibling in element.previous_siblings:
+        if isinstance(sibling, Tag) and sibling.name in ("h2", "h3"):
+            yield sibling
+
+
 def is_in_excluded_section(element: Tag, excluded_ids: set = EXCLUDED_CRAFTING_SECTIONS) -> bool:
     """
     Check if element is within an excluded section (e.g., Removed_recipes, Changed_recipes).
@@ -82,7 +151,7 @@ def is_in_excluded_section(element: Tag, excluded_ids: set = EXCLUDED_CRAFTING_S
         # Also check for child spans with mw-headline class (wiki heading structure)
         # Pattern: <h3><span class="mw-headline" id="Removed_recipes">
         if current.name in ['h2', 'h3', 'h4']:
-            headline = current.find('span', class_='mw-headline')
+            headline = current.find(MW_HEADLINE_FILTER)
             if headline:
                 headline_id = headline.get('id')
                 if headline_id and headline_id in excluded_ids:
@@ -90,8 +159,8 @@ def is_in_excluded_section(element: Tag, excluded_ids: set = EXCLUDED_CRAFTING_S
 
         # Check if we're past a heading with excluded ID
         # Find previous siblings that are headings
-        for sibling in current.find_previous_siblings(['h2', 'h3']):
-            headline = sibling.find('span', class_='mw-headline')
+        for sibling in iter_previous_headings(current):
+            headline = sibling.find(MW_HEADLINE_FILTER)
             if headline:
                 sibling_id = headline.get('id')
                 if sibling_id and sibling_id in excluded_ids:
@@ -122,31 +191,34 @@ def extract_item_from_link(link_tag: Tag) -> Optional[Item]:
     if not href or not href.startswith("/w/"):
         return None
 
-    # Check if link is within an infobox or metadata section
-    # These are captions/metadata, not actual game items
-    parent = link_tag.parent
-    while parent:
+    # Walk the ancestors once: reject infobox/metadata links (captions, not actual game items)
+    # and remember the nearest <li> and <td> for the inline edition marker check below
+    marker_containers: Dict[str, Tag] = {}
+    for parent in link_tag.parents:
         # Check for infobox-related classes
         parent_classes = parent.get("class", [])
         if isinstance(parent_classes, list):
             if any(cls in parent_classes for cls in ["infobox-imagecaption", "infobox", "notaninfobox"]):
                 return None
-        parent = parent.parent
+        if parent.name in ("li", "td") and parent.name not in marker_containers:
+            marker_containers[parent.name] = parent
 
     # Check for inline edition markers next to this link (e.g., in same <li> or <td>)
     # Pattern: <a href="/w/Item">Item</a>‌<sup class="Inline-Template">[BE only]</sup>
     # Check both <li> (for list-based tables) and <td> (for regular tables)
-    for parent_type in ["li", "td"]:
-        parent_element = link_tag.find_parent(parent_type)
-        if parent_element:
-            # Look for sup elements with Inline-Template class in this parent
-            sup_markers = parent_element.find_all("sup", class_="Inline-Template")
-            for sup in sup_markers:
-                sup_text = sup.get_text().lower()
-                # Check for Bedrock/Education edition markers
-                # BE = Bedrock Edition abbreviation
-                if ("bedrock" in sup_text or "education" in sup_text or ("be" in sup_text and "only" in sup_text)):
-                    return None
+    for parent_element in marker_containers.values():
+        # Marker text is part of the container text: skip the <sup> scan when no marker can match
+        if not INLINE_MARKER_HINT_PATTERN.search(parent_element.get_text().lower()):
+            continue
+
+        # Look for sup elements with Inline-Template class in this parent
+        sup_markers = parent_element.find_all("sup", class_="Inline-Template")
+        for sup in sup_markers:
+            sup_text = sup.get_text().lower()
+            # Check for Bedrock/Education edition markers
+            # BE = Bedrock Edition abbreviation
+            if ("bedrock" in sup_text or "education" in sup_text or ("be" in sup_text and "only" in sup_text)):
+                return None
 
     # Extract name from href (remove /w/ prefix and decode underscores)
     name = href[3:].replace("_", " ")
@@ -202,11 +274,11 @@ def find_item_in_slot(slot: Tag) -> List[Item]:
     items: List[Item] = []
 
     # Find all item containers in this slot
-    item_containers = slot.find_all("span", class_="invslot-item")
+    item_containers = slot.find_all(INVSLOT_ITEM_FILTER)
 
     for container in item_containers:
         # Look for link to item
-        link = container.find("a", href=re.compile(r"^/w/"))
+        link = container.find(WIKI_LINK_FILTER)
         if link:
             item = extract_item_from_link(link)
             if item:
@@ -229,9 +301,9 @@ def extract_category_from_element(element: Tag) -> Optional[str]:
     current = element
     while current:
         # Look for previous sibling headings (h2/h3)
-        for sibling in current.find_previous_siblings(['h2', 'h3']):
+        for sibling in iter_previous_headings(current):
             # Find mw-headline span inside the heading
-            headline = sibling.find('span', class_='mw-headline')
+            headline = sibling.find(MW_HEADLINE_FILTER)
             if headline:
                 headline_id = headline.get('id')
                 # Skip excluded sections
@@ -253,22 +325,22 @@ def extract_category_from_element(element: Tag) -> Optional[str]:
     return None
 
 
-def parse_crafting(html_content: str) -> List[Transformation]:
+def parse_crafting(html_content: Union[str, bytes]) -> List[Transformation]:
     """
     Parse crafting recipes from HTML content.
 
     Args:
-        html_content: HTML content from crafting wiki page
+        html_content: HTML content from crafting wiki page (str or raw bytes)
 
     Returns:
         List of Transformation objects for crafting recipes (deduplicated)
     """
-    soup = BeautifulSoup(html_content, "lxml")
+    soup = parse_article_content(html_content)
     transformations: List[Transformation] = []
     seen_signatures = set()
 
     # Find all crafting table UI elements
-    crafting_uis = soup.find_all("span", class_=re.compile(r"mcui.*Crafting.*Table"))
+    crafting_uis = soup.find_all(CRAFTING_TABLE_UI_FILTER)
 
     for ui in crafting_uis:
         if not is_java_edition(ui):
@@ -279,13 +351,13 @@ def parse_crafting(html_content: str) -> List[Transformation]:
             continue
 
         # Extract inputs from mcui-input section
-        input_section = ui.find("span", class_="mcui-input")
+        input_section = ui.find(MCUI_INPUT_FILTER)
         if not input_section:
             continue
 
         # Collect all input items
         input_items: List[Item] = []
-        slots = input_section.find_all("span", class_="invslot")
+        slots = input_section.find_all(INVSLOT_FILTER)
 
         # Track if any slot has alternatives
         has_alternatives = False
@@ -301,7 +373,7 @@ def parse_crafting(html_content: str) -> List[Transformation]:
                     input_items.append(items_in_slot[0])
 
         # Extract output from mcui-output section
-        output_section = ui.find("span", class_="mcui-output")
+        output_section = ui.find(MCUI_OUTPUT_FILTER)
         if not output_section:
             continue
 
@@ -453,7 +525,7 @@ def parse_crafting(html_content: str) -> List[Transformation]:
     return transformations
 
 
-def parse_tool_crafting(html_content: str) -> List[Transformation]:
+def parse_tool_crafting(html_content: Union[str, bytes]) -> List[Transformation]:
     """
     Parse tool crafting recipes from the Tool wiki page HTML content.
 
@@ -461,17 +533,17 @@ def parse_tool_crafting(html_content: str) -> List[Transformation]:
     includes animated/cycling recipe graphics showing alternative ingredients.
 
     Args:
-        html_content: HTML content from the Tool wiki page
+        html_content: HTML content from the Tool wiki page (str or raw bytes)
 
     Returns:
         List of Transformation objects for tool crafting recipes (deduplicated)
     """
-    soup = BeautifulSoup(html_content, "lxml")
+    soup = parse_article_content(html_content)
     transformations: List[Transformation] = []
     seen_signatures = set()
 
     # Find all crafting table UI elements
-    crafting_uis = soup.find_all("span", class_=re.compile(r"mcui.*Crafting.*Table"))
+    crafting_uis = soup.find_all(CRAFTING_TABLE_UI_FILTER)
 
     for ui in crafting_uis:
         if not is_java_edition(ui):
@@ -482,13 +554,13 @@ def parse_tool_crafting(html_content: str) -> List[Transformation]:
             continue
 
         # Extract inputs from mcui-input section
-        input_section = ui.find("span", class_="mcui-input")
+        input_section = ui.find(MCUI_INPUT_FILTER)
         if not input_section:
             continue
 
         # Collect all input items
         input_items: List[Item] = []
-        slots = input_section.find_all("span", class_="invslot")
+        slots = input_section.find_all(INVSLOT_FILTER)
 
         # Track if any slot has alternatives
         has_alternatives = False
@@ -504,7 +576,7 @@ def parse_tool_crafting(html_content: str) -> List[Transformation]:
                     input_items.append(items_in_slot[0])
 
         # Extract output from mcui-output section
-        output_section = ui.find("span", class_="mcui-output")
+        output_section = ui.find(MCUI_OUTPUT_FILTER)
         if not output_section:
             continue
 
@@ -652,6 +724,23 @@ def parse_tool_crafting(html_content: str) -> List[Transformation]:
     return transformations
 
 
+def parse_tool_crafting_file(file_path: Union[str, Path]) -> List[Transformation]:
+    """
+    Parse tool crafting recipes directly from a downloaded Tool page file.
+
+    The raw bytes are handed to lxml, which detects the encoding and decodes
+    them itself, so no intermediate Python string copy of the page is built.
+
+    Args:
+        file_path: Path to the downloaded Tool wiki page
+
+    Returns:
+        List of Transformation objects for tool crafting recipes (deduplicated)
+    """
+    with open(file_path, "rb") as f:
+        return parse_tool_crafting(f.read())
+
+
 def parse_smelting(html_content: str) -> List[Transformation]:
     """
     Parse smelting recipes from HTML content.
@@ -713,7 +802,7 @@ def parse_smelting(html_content: str) -> List[Transformation]:
 
             # Extract output item from Product column (first <th>)
             output_cell = cells[product_col]
-            output_links = output_cell.find_all("a", href=re.compile(r"^/w/"))
+            output_links = output_cell.find_all(WIKI_LINK_FILTER)
             if not output_links:
                 continue
 
@@ -729,16 +818,16 @@ def parse_smelting(html_content: str) -> List[Transformation]:
             ingredient_parts = []
 
             # Find all invslot elements
-            invslots = ingredient_cell.find_all("span", class_="invslot")
+            invslots = ingredient_cell.find_all(INVSLOT_FILTER)
             if invslots:
                 # Get links from each invslot
                 for invslot in invslots:
-                    links = invslot.find_all("a", href=re.compile(r"^/w/"))
+                    links = invslot.find_all(WIKI_LINK_FILTER)
                     if links:
                         ingredient_parts.append(extract_item_from_link(links[0]))
             else:
                 # Fallback: find all links directly
-                ingredient_links = ingredient_cell.find_all("a", href=re.compile(r"^/w/"))
+                ingredient_links = ingredient_cell.find_all(WIKI_LINK_FILTER)
                 for link in ingredient_links:
                     ingredient_parts.append(extract_item_from_link(link))
 
@@ -801,7 +890,7 @@ def parse_smithing(html_content: str) -> List[Transformation]:
                     inputs.extend(items)
 
         # Extract output
-        output_section = ui.find("span", class_="mcui-output")
+        output_section = ui.find(MCUI_OUTPUT_FILTER)
         if not output_section:
             continue
 
@@ -844,14 +933,14 @@ def parse_stonecutter(html_content: str) -> List[Transformation]:
             continue
 
         # Extract input
-        input_section = ui.find("span", class_="mcui-input")
+        input_section = ui.find(MCUI_INPUT_FILTER)
         if not input_section:
             continue
 
         input_items = find_item_in_slot(input_section)
 
         # Extract output
-        output_section = ui.find("span", class_="mcui-output")
+        output_section = ui.find(MCUI_OUTPUT_FILTER)
         if not output_section:
             continue
 
@@ -933,7 +1022,7 @@ def parse_trading(html_content: str) -> List[Transformation]:
             cells_with_items = []
             for i, cell in enumerate(cells):
                 # Check if cell contains item links
-                item_links = cell.find_all("a", href=re.compile(r"^/w/"))
+                item_links = cell.find_all(WIKI_LINK_FILTER)
                 if item_links:
                     cells_with_items.append((i, cell, item_links))
 
@@ -1031,7 +1120,7 @@ def extract_items_from_element(element: Tag) -> List[Item]:
     seen_names = set()
 
     # Find all links with /w/ pattern
-    links = element.find_all("a", href=re.compile(r"^/w/"))
+    links = element.find_all(WIKI_LINK_FILTER)
 
     for link in links:
         item = extract_item_from_link(link)
@@ -1122,7 +1211,7 @@ def parse_mob_drops(html_content: str, mob_name: str) -> List[Transformation]:
 
             # First cell usually contains item
             item_cell = cells[0]
-            links = item_cell.find_all("a", href=re.compile(r"^/w/"))
+            links = item_cell.find_all(WIKI_LINK_FILTER)
 
             for link in links:
                 item = extract_item_from_link(link)
@@ -1178,7 +1267,7 @@ def parse_mob_drops(html_content: str, mob_name: str) -> List[Transformation]:
         subsections = find_subsections(drops_section)
         for subsection_heading, _ in subsections:
             # Extract ID from the nested span with class="mw-headline"
-            id_span = subsection_heading.find('span', class_='mw-headline')
+            id_span = subsection_heading.find(MW_HEADLINE_FILTER)
             subsection_id = id_span.get('id', '') if id_span else subsection_heading.get('id', '')
             subsection_text = subsection_heading.get_text().lower()
 
@@ -1199,7 +1288,7 @@ def parse_mob_drops(html_content: str, mob_name: str) -> List[Transformation]:
                         list_items = current_elem.find_all("li")
                         for li in list_items:
                             # Extract items from links within the list item
-                            links = li.find_all("a", href=re.compile(r"^/w/"))
+                            links = li.find_all(WIKI_LINK_FILTER)
                             for link in links:
                                 item = extract_item_from_link(link)
                                 if item:
@@ -1263,7 +1352,7 @@ def parse_brewing(html_content: str) -> List[Transformation]:
         base_slot = ui.find("span", class_=re.compile(r"mcui-input.*base"))
         if not base_slot:
             # Try finding any input slot
-            base_slot = ui.find("span", class_="mcui-input")
+            base_slot = ui.find(MCUI_INPUT_FILTER)
 
         base_items: List[Item] = []
         if base_slot:
@@ -1276,7 +1365,7 @@ def parse_brewing(html_content: str) -> List[Transformation]:
             ingredient_items = find_item_in_slot(ingredient_slot)
 
         # Extract output
-        output_section = ui.find("span", class_="mcui-output")
+        output_section = ui.find(MCUI_OUTPUT_FILTER)
         if not output_section:
             continue
 
@@ -1378,7 +1467,7 @@ def parse_composting(html_content: str) -> List[Transformation]:
                 success_rate = success_rates[col_idx] if col_idx < len(success_rates) else 0.0
 
                 # Find all item links in this cell (may be in <ul> lists)
-                links = cell.find_all("a", href=re.compile(r"^/w/"))
+                links = cell.find_all(WIKI_LINK_FILTER)
 
                 for link in links:
                     item = extract_item_from_link(link)
@@ -1429,7 +1518,7 @@ def parse_grindstone(html_content: str) -> List[Transformation]:
             input_items.extend(items)
 
         # Extract output (disenchanted item)
-        output_section = ui.find("span", class_="mcui-output")
+        output_section = ui.find(MCUI_OUTPUT_FILTER)
         if not output_section:
             continue
 
@@ -1498,7 +1587,7 @@ def parse_bartering(html_content: str) -> List[Transformation]:
 
             # Extract items from the "Item given" cell
             # Some cells have multiple items separated by line breaks (alternative items)
-            item_links = item_given_cell.find_all("a", href=re.compile(r"^/w/"))
+            item_links = item_given_cell.find_all(WIKI_LINK_FILTER)
 
             for link in item_links:
                 # Filter out edition marker links (JE/BE links)
@@ -1,27 +1,58 @@
 """Generate interactive 3D visualization of Minecraft transformation graphs using NetworkX and Matplotlib."""
 
 import argparse
+import contextlib
 import csv
-import json
+import functools
 import logging
+import os
+import re
 import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Collection, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
 
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 import networkx as nx
 import numpy as np
-from mpl_toolkits.mplot3d import Axes3D, proj3d
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-from matplotlib.widgets import Slider
 
 try:
     from pyfzf.pyfzf import FzfPrompt
 except ImportError:
     FzfPrompt = None
 
+# src/ is on sys.path when run as a script; the tests import through the
+# src package instead
+try:
+    from core.json_cells import decode_json_cell
+except ImportError:
+    from src.core.json_cells import decode_json_cell
+
+# Characters stripped from image filenames: \W is everything except str.isalnum() and "_"
+FILENAME_INVALID_CHARS_PATTERN = re.compile(r"\W")
+UNDERSCORE_RUN_PATTERN = re.compile(r"_{2,}")
+
+# Delay after the last mouse release before the view is redrawn
+REFRESH_DEBOUNCE_MS = 50
+
+# File holding decoded icons between runs, under the user cache directory
+ICON_DISK_CACHE_FILE = Path("minegraph") / "icons.npz"
+
+# Bumped whenever the stored icon arrays change meaning, so older cache files
+# are ignored instead of restored (version 1 stores icons at file resolution)
+ICON_DISK_CACHE_VERSION = 1
+
+# Default memory budget for decoded item images held by ImageCache
+IMAGE_CACHE_MAX_MB = 256
+
+# matplotlib is imported on first use by _import_matplotlib() so that the CSV
+# and graph building helpers do not pay its import cost
+plt = None
+proj3d = None
+OffsetImage = None
+AnnotationBbox = None
+Slider = None
+
 
 # Default color mappings if config file is missing or incomplete
 DEFAULT_COLORS = {
@@ -39,6 +70,23 @@ DEFAULT_COLORS = {
 }
 
 
+def _import_matplotlib() -> None:
+    """
+    Import the matplotlib modules used for rendering.
+
+    Names that are already bound (for example patched by tests) are left as is.
+    """
+    global plt, proj3d, OffsetImage, AnnotationBbox, Slider
+    if plt is None:
+        import matplotlib.pyplot as plt
+    if proj3d is None:
+        from mpl_toolkits.mplot3d import proj3d
+    if OffsetImage is None or AnnotationBbox is None:
+        from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+    if Slider is None:
+        from matplotlib.widgets import Slider
+
+
 def prompt_boolean_options() -> Dict[str, bool]:
     """
     Present an interactive checkbox menu for boolean flags using fzf.
@@ -84,35 +132,77 @@ def prompt_boolean_options() -> Dict[str, bool]:
         sys.exit(0)
 
 
-def load_transformation_types(csv_path: str) -> List[str]:
+def load_transformation_types(csv_source: Union[str, TextIO]) -> List[str]:
     """
     Extract unique transformation types from CSV file.
 
+    Results for paths are cached per path and modification time, so the
+    interactive type prompt and later calls only re-read the file after it
+    changes. Open text streams are read directly.
+
     Args:
-        csv_path: Path to transformations CSV file
+        csv_source: Path to transformations CSV file, or an open text stream
 
     Returns:
         Sorted list of unique transformation types
     """
-    types = set()
+    if hasattr(csv_source, 'read'):
+        return list(_read_transformation_types(csv_source))
 
-    csv_file = Path(csv_path)
-    if not csv_file.exists():
-        logging.warning(f"CSV file not found: {csv_path}")
+    try:
+        mtime_ns = os.stat(csv_source).st_mtime_ns
+    except OSError:
+        logging.warning(f"CSV file not found: {csv_source}")
         return []
 
+    return list(_load_transformation_types_cached(str(csv_source), mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_transformation_types_cached(csv_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Read the unique transformation types of a CSV file.
+
+    Args:
+        csv_path: Path to transformations CSV file
+        mtime_ns: Modification time of the file, part of the cache key only
+
+    Returns:
+        Sorted tuple of unique transformation types
+    """
+    try:
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            return _read_transformation_types(f)
+    except OSError as e:
+        logging.error(f"Error reading transformation types: {e}")
+        return ()
+
+
+def _read_transformation_types(csv_file: TextIO) -> Tuple[str, ...]:
+    """
+    Collect the unique values of the transformation_type column.
+
+    Args:
+        csv_file: Open CSV text stream
+
+    Returns:
+        Sorted tuple of unique transformation types
+    """
+    types = set()
+
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if 'transformation_type' in row:
-                    types.add(row['transformation_type'])
-
-        logging.debug(f"Found {len(types)} unique transformation types")
-        return sorted(list(types))
+        # Only the type column is needed, so skip building per-row dicts
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
+        if 'transformation_type' in header:
+            type_idx = header.index('transformation_type')
+            types.update(row[type_idx] for row in reader if len(row) > type_idx)
     except Exception as e:
         logging.error(f"Error reading transformation types: {e}")
-        return []
+        return ()
+
+    logging.debug(f"Found {len(types)} unique transformation types")
+    return tuple(sorted(types))
 
 
 def prompt_transformation_types(csv_path: str) -> Optional[List[str]]:
@@ -168,78 +258,342 @@ def prompt_transformation_types(csv_path: str) -> Optional[List[str]]:
         sys.exit(0)
 
 
-def load_color_config(config_path: str) -> Dict[str, str]:
+def load_color_config(config_source: Union[str, TextIO]) -> Dict[str, str]:
     """
     Load color configuration from file.
 
     Args:
-        config_path: Path to the color configuration file
+        config_source: Path to the color configuration file, or an open text stream
 
     Returns:
         Dictionary mapping transformation types to color codes
     """
-    colors = DEFAULT_COLORS.copy()
+    if hasattr(config_source, 'read'):
+        return _parse_color_lines(config_source)
 
-    config_file = Path(config_path)
+    config_file = Path(config_source)
     if not config_file.exists():
-        logging.warning(f"Config file not found at {config_path}, using default colors")
-        return colors
+        logging.warning(f"Config file not found at {config_source}, using default colors")
+        return DEFAULT_COLORS.copy()
 
     try:
         with open(config_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-
-                # Parse key=value format
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key and value:
-                        colors[key] = value
-
-        logging.info(f"Loaded {len(colors)} color mappings from {config_path}")
+            colors = _parse_color_lines(f)
+
+        logging.info(f"Loaded {len(colors)} color mappings from {config_source}")
     except Exception as e:
         logging.error(f"Error loading config file: {e}, using default colors")
+        colors = DEFAULT_COLORS.copy()
+
+    return colors
+
+
+def _parse_color_lines(lines: Iterable[str]) -> Dict[str, str]:
+    """
+    Parse key=value color lines on top of the default colors.
+
+    Args:
+        lines: Lines of a color configuration file
+
+    Returns:
+        Dictionary mapping transformation types to color codes
+    """
+    colors = DEFAULT_COLORS.copy()
+
+    for line in lines:
+        line = line.strip()
+        # Skip comments and empty lines
+        if not line or line.startswith('#'):
+            continue
+
+        # Parse key=value format
+        if '=' in line:
+            key, value = line.split('=', 1)
+            key = key.strip()
+            value = value.strip()
+            if key and value:
+                colors[key] = value
 
     return colors
 
 
+@functools.lru_cache(maxsize=4096)
 def standardize_filename(item_name: str) -> str:
     """
     Convert item name to standardized filename format.
 
+    Results are memoized, since the same item names are looked up again on
+    every render.
+
     Args:
         item_name: Original item name (e.g., "Iron Ingot")
 
     Returns:
         Standardized filename (e.g., "iron_ingot.png")
     """
-    import re
     # Convert to lowercase and replace spaces with underscores
     filename = item_name.lower().replace(" ", "_")
     # Remove special characters that might cause issues
-    filename = "".join(c for c in filename if c.isalnum() or c == "_")
+    filename = FILENAME_INVALID_CHARS_PATTERN.sub("", filename)
     # Collapse multiple underscores into one
-    filename = re.sub(r"_+", "_", filename)
+    filename = UNDERSCORE_RUN_PATTERN.sub("_", filename)
     return f"{filename}.png"
 
 
+@functools.lru_cache(maxsize=32)
+def _list_images(images_dir: str) -> FrozenSet[str]:
+    """
+    List the image files of a directory once per process.
+
+    Lets load_item_image() and prefetch_item_images() check many items with
+    a set lookup instead of a stat call each. The listing is not refreshed,
+    so images added while the program runs are not picked up.
+
+    Args:
+        images_dir: Directory containing images
+
+    Returns:
+        Names of the files in the directory (empty if it cannot be read)
+    """
+    try:
+        with os.scandir(images_dir) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+class ImageCache:
+    """
+    Least-recently-used cache of item images bounded by total array size.
+
+    Supports the dictionary operations used by the image loaders (``in``,
+    item access and assignment). Reading an entry marks it as recently used;
+    storing one evicts the least recently used entries until the decoded
+    images fit in ``max_bytes``. Misses are cached as None and cost nothing.
+    Setting the DISABLE_LRU_CACHE environment variable turns eviction off.
+    """
+
+    def __init__(self, max_bytes: int = IMAGE_CACHE_MAX_MB * 1024 * 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached image arrays
+        """
+        self.max_bytes = max_bytes
+        self.evict = not os.environ.get("DISABLE_LRU_CACHE")
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, Optional[np.ndarray]] = OrderedDict()
+
+    def __contains__(self, item_name: str) -> bool:
+        return item_name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, item_name: str) -> Optional[np.ndarray]:
+        img = self._entries[item_name]
+        self._entries.move_to_end(item_name)
+        return img
+
+    def __setitem__(self, item_name: str, img: Optional[np.ndarray]) -> None:
+        self.put(item_name, img)
+
+    def get(self, item_name: str, default: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Return a cached image and mark it as recently used.
+
+        Args:
+            item_name: Name of the item
+            default: Value returned when the item is not cached
+
+        Returns:
+            Cached image (or None for a cached miss), default if not cached
+        """
+        if item_name not in self._entries:
+            return default
+        return self[item_name]
+
+    def put(self, item_name: str, img: Optional[np.ndarray]) -> None:
+        """
+        Store an image, evicting least recently used images if over the limit.
+
+        Args:
+            item_name: Name of the item
+            img: Decoded image, or None if the item has no image
+        """
+        previous = self._entries.pop(item_name, None)
+        if previous is not None:
+            self.total_bytes -= previous.nbytes
+
+        self._entries[item_name] = img
+        if img is None:
+            return
+        self.total_bytes += img.nbytes
+
+        while self.evict and self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            if evicted is not None:
+                self.total_bytes -= evicted.nbytes
+
+
+def default_icon_cache_path() -> Path:
+    """
+    Return the default location of the on-disk icon cache.
+
+    Returns:
+        Path under $XDG_CACHE_HOME (or ~/.cache when unset)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / ICON_DISK_CACHE_FILE
+
+
+class DiskIconCache(ImageCache):
+    """
+    ImageCache that keeps decoded icons on disk between runs.
+
+    Icons are stored in a single .npz file keyed by image filename and
+    validated against the file's modification time, so edited or replaced
+    images are decoded again. Call preload() before rendering to fill the
+    cache from disk and save() afterwards to persist newly decoded icons.
+    """
+
+    def __init__(
+        self,
+        images_dir: str,
+        cache_path: Optional[Union[str, Path]] = None,
+        max_bytes: int = IMAGE_CACHE_MAX_MB * 1024 * 1024
+    ):
+        """
+        Initialize the cache for one images directory.
+
+        Args:
+            images_dir: Directory containing item images
+            cache_path: Location of the .npz cache file (default: default_icon_cache_path())
+            max_bytes: Maximum total size of the cached image arrays
+        """
+        super().__init__(max_bytes)
+        self.images_dir = images_dir
+        self.cache_path = Path(cache_path) if cache_path else default_icon_cache_path()
+        # Image filename -> (mtime_ns, icon) for icons valid on disk
+        self._stored: Dict[str, Tuple[int, np.ndarray]] = {}
+        # Image filename -> mtime_ns for the current images directory
+        self._mtimes: Dict[str, int] = {}
+
+    def preload(self, item_names: Iterable[str]) -> int:
+        """
+        Fill the cache with icons stored on disk for the given items.
+
+        Args:
+            item_names: Names of the items about to be rendered
+
+        Returns:
+            Number of icons restored from disk
+        """
+        try:
+            with os.scandir(self.images_dir) as entries:
+                self._mtimes = {
+                    entry.name: entry.stat().st_mtime_ns for entry in entries if entry.is_file()
+                }
+        except OSError:
+            self._mtimes = {}
+
+        self._stored = self._read_store()
+
+        restored = 0
+        for item_name in item_names:
+            filename = standardize_filename(item_name)
+            stored = self._stored.get(filename)
+            if stored is not None and stored[0] == self._mtimes.get(filename):
+                self[item_name] = stored[1]
+                restored += 1
+
+        logging.debug(f"Restored {restored} icons from {self.cache_path}")
+        return restored
+
+    def save(self) -> bool:
+        """
+        Write the cached icons to disk if any were decoded since preload().
+
+        The file is written to a temporary name and renamed into place, so an
+        interrupted run never leaves a truncated cache behind.
+
+        Returns:
+            True if the cache file was rewritten
+        """
+        icons = dict(self._stored)
+        changed = False
+        for item_name, img in self._entries.items():
+            filename = standardize_filename(item_name)
+            mtime_ns = self._mtimes.get(filename)
+            if img is None or mtime_ns is None:
+                continue
+            if icons.get(filename, (None,))[0] != mtime_ns:
+                icons[filename] = (mtime_ns, img)
+                changed = True
+
+        if not changed:
+            return False
+
+        filenames = list(icons)
+        arrays = {f"icon_{i}": icons[name][1] for i, name in enumerate(filenames)}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp.npz")
+            np.savez(
+                tmp_path,
+                version=np.int64(ICON_DISK_CACHE_VERSION),
+                filenames=np.array(filenames, dtype=str),
+                mtimes=np.array([icons[name][0] for name in filenames], dtype=np.int64),
+                **arrays
+            )
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write icon cache {self.cache_path}: {e}")
+            return False
+
+        self._stored = icons
+        logging.debug(f"Saved {len(icons)} icons to {self.cache_path}")
+        return True
+
+    def _read_store(self) -> Dict[str, Tuple[int, np.ndarray]]:
+        """
+        Read the icons stored on disk.
+
+        Returns:
+            Mapping of image filename to (mtime_ns, icon); empty if the file is
+            missing, unreadable or was written by a different cache version
+        """
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as data:
+                if "version" not in data.files or int(data["version"]) != ICON_DISK_CACHE_VERSION:
+                    return {}
+                return {
+                    str(name): (int(mtime_ns), data[f"icon_{i}"])
+                    for i, (name, mtime_ns) in enumerate(zip(data["filenames"], data["mtimes"]))
+                }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable icon cache {self.cache_path}: {e}")
+            return {}
+
+
 def load_item_image(
     item_name: str,
     images_dir: str,
-    image_cache: Dict[str, Optional[np.ndarray]]
+    image_cache: ImageCache
 ) -> Optional[np.ndarray]:
     """
     Load an item image from disk with caching.
 
+    Images are decoded with Pillow straight into a uint8 RGBA array, which
+    skips the float32 conversion done by matplotlib.image.imread.
+
     Args:
         item_name: Name of the item
         images_dir: Directory containing images
-        image_cache: Dictionary to cache loaded images
+        image_cache: Cache of loaded images (an ImageCache or a plain dict)
 
     Returns:
         Image array if found, None otherwise
@@ -250,87 +604,241 @@ def load_item_image(
 
     # Generate standardized filename
     filename = standardize_filename(item_name)
-    image_path = Path(images_dir) / filename
 
-    # Try to load the image
-    try:
-        if image_path.exists():
-            img = mpimg.imread(str(image_path))
-            image_cache[item_name] = img
-            logging.debug(f"Loaded image for {item_name}: {image_path}")
-            return img
+    if filename not in _list_images(str(images_dir)):
+        logging.debug(f"No image found for {item_name}: {filename} in {images_dir}")
+        image_cache[item_name] = None
+        return None
+
+    return _decode_into_cache(item_name, Path(images_dir) / filename, image_cache)
+
+
+def prefetch_item_images(
+    item_names: Iterable[str],
+    images_dir: str,
+    image_cache: ImageCache
+) -> Dict[str, Future]:
+    """
+    Start decoding the images of many items on a background thread pool.
+
+    Uses the cached directory listing from _list_images() instead of checking
+    each item's file separately, so items without an icon cost a set lookup
+    rather than a stat call; they are cached as None right away. Items
+    already in the cache are skipped. Pass the returned futures to
+    store_item_images() once the images are needed.
+
+    Args:
+        item_names: Names of the items to load
+        images_dir: Directory containing images
+        image_cache: Cache of loaded images (an ImageCache or a plain dict)
+
+    Returns:
+        Dictionary mapping item names to futures of their decoded images
+    """
+    available = _list_images(str(images_dir))
+    images_path = Path(images_dir)
+    futures: Dict[str, Future] = {}
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    for item_name in item_names:
+        if item_name in image_cache or item_name in futures:
+            continue
+        filename = standardize_filename(item_name)
+        if filename in available:
+            futures[item_name] = executor.submit(_read_image, images_path / filename)
         else:
-            logging.debug(f"No image found for {item_name}: {image_path}")
             image_cache[item_name] = None
-            return None
+    # Submitted decodes keep running; this only releases the workers afterwards
+    executor.shutdown(wait=False)
+
+    logging.debug(f"Prefetching {len(futures)} images from {images_dir}")
+    return futures
+
+
+def store_item_images(futures: Dict[str, Future], image_cache: ImageCache) -> None:
+    """
+    Wait for prefetched images and store them (or None on failure) in the cache.
+
+    Args:
+        futures: Futures returned by prefetch_item_images()
+        image_cache: Cache of loaded images (an ImageCache or a plain dict)
+    """
+    for item_name, future in futures.items():
+        try:
+            image_cache[item_name] = future.result()
+        except Exception as e:
+            logging.warning(f"Failed to load image for {item_name}: {e}")
+            image_cache[item_name] = None
+
+
+def preload_item_images(
+    item_names: Iterable[str],
+    images_dir: str,
+    image_cache: ImageCache
+) -> None:
+    """
+    Load the images of many items into the cache, decoding them in parallel.
+
+    Args:
+        item_names: Names of the items to load
+        images_dir: Directory containing images
+        image_cache: Cache of loaded images (an ImageCache or a plain dict)
+    """
+    store_item_images(prefetch_item_images(item_names, images_dir, image_cache), image_cache)
+
+
+def _read_image(image_path: Path) -> np.ndarray:
+    """
+    Decode an image file with Pillow into a uint8 RGBA array.
+
+    Args:
+        image_path: Path of the image file
+
+    Returns:
+        Decoded image array
+    """
+    from PIL import Image
+
+    with Image.open(image_path) as pil_img:
+        return np.asarray(pil_img.convert("RGBA"))
+
+
+def _decode_into_cache(
+    item_name: str,
+    image_path: Path,
+    image_cache: ImageCache
+) -> Optional[np.ndarray]:
+    """
+    Decode one image file and store the result (or None on failure) in the cache.
+
+    Args:
+        item_name: Name of the item, used as the cache key
+        image_path: Path of the image file
+        image_cache: Cache of loaded images (an ImageCache or a plain dict)
+
+    Returns:
+        Image array if decoded, None otherwise
+    """
+    try:
+        img = _read_image(image_path)
     except Exception as e:
         logging.warning(f"Failed to load image for {item_name}: {e}")
         image_cache[item_name] = None
         return None
 
+    image_cache[item_name] = img
+    logging.debug(f"Loaded image for {item_name}: {image_path}")
+    return img
 
-def load_transformations_from_csv(
-    csv_path: str,
-    filter_types: Optional[List[str]] = None
-) -> List[Dict]:
+
+def iter_transformations_from_csv(
+    csv_source: Union[str, TextIO],
+    filter_types: Optional[Collection[str]] = None
+) -> Iterator[Dict]:
     """
-    Load transformations from CSV file with optional type filtering.
+    Stream transformations from CSV file with optional type filtering.
+
+    Only rows matching the filter are decoded and yielded, so memory use is
+    bounded by a single row rather than the whole file.
 
     Args:
-        csv_path: Path to the transformations CSV file
-        filter_types: Optional list of transformation types to include (None = all types)
+        csv_source: Path to the transformations CSV file, or an open text stream
+        filter_types: Optional list or set of transformation types to include (None = all types)
 
-    Returns:
-        List of transformation dictionaries with parsed data
+    Yields:
+        Transformation dictionaries with parsed data
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist (on first iteration)
     """
-    transformations = []
+    loaded_count = 0
     total_count = 0
     filtered_count = 0
 
-    csv_file = Path(csv_path)
-    if not csv_file.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
-
-    # Convert filter_types to set for faster lookup
-    filter_set = set(filter_types) if filter_types else None
+    if hasattr(csv_source, 'read'):
+        csv_context = contextlib.nullcontext(csv_source)
+    else:
+        csv_file = Path(csv_source)
+        if not csv_file.exists():
+            raise FileNotFoundError(f"CSV file not found: {csv_source}")
+        csv_context = open(csv_file, 'r', encoding='utf-8', newline='')
+
+    # Convert filter_types to a set for faster lookup (a frozenset is reused as is)
+    filter_set = frozenset(filter_types) if filter_types else None
+
+    with csv_context as f:
+        # Plain csv.reader with column indices resolved once from the header,
+        # avoiding the per-row dict built by csv.DictReader
+        reader = csv.reader(f)
+        header = next(reader, [])
+        try:
+            type_idx = header.index('transformation_type')
+            inputs_idx = header.index('input_items')
+            outputs_idx = header.index('output_items')
+            metadata_idx = header.index('metadata')
+        except ValueError as e:
+            logging.warning(f"Skipping CSV with missing column: {e}")
+            return
+        row_length = max(type_idx, inputs_idx, outputs_idx, metadata_idx) + 1
 
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
         for row in reader:
+            if not row:
+                continue
+            total_count += 1
+
+            if len(row) < row_length:
+                logging.warning(f"Skipping short row: {row}")
+                continue
+            trans_type = row[type_idx]
+
+            # Apply type filtering before any JSON is decoded
+            if filter_set is not None and trans_type not in filter_set:
+                filtered_count += 1
+                continue
+
             # Parse JSON arrays in input_items and output_items
             try:
-                total_count += 1
-                trans_type = row['transformation_type']
-
-                # Apply type filtering if specified
-                if filter_set is not None and trans_type not in filter_set:
-                    filtered_count += 1
-                    continue
-
-                inputs = json.loads(row['input_items'])
-                outputs = json.loads(row['output_items'])
-                metadata = json.loads(row['metadata'])
-
-                transformation = {
-                    'transformation_type': trans_type,
-                    'input_items': inputs,
-                    'output_items': outputs,
-                    'metadata': metadata
-                }
-                transformations.append(transformation)
-            except (json.JSONDecodeError, KeyError) as e:
+                inputs = decode_json_cell(row[inputs_idx], list)
+                outputs = decode_json_cell(row[outputs_idx], list)
+                metadata = decode_json_cell(row[metadata_idx], dict)
+            except ValueError as e:
                 logging.warning(f"Skipping malformed row: {e}")
                 continue
 
+            loaded_count += 1
+            yield {
+                'transformation_type': trans_type,
+                'input_items': inputs,
+                'output_items': outputs,
+                'metadata': metadata
+            }
+
     if filter_types:
         logging.info(
-            f"Loaded {len(transformations)} transformations from {csv_path} "
+            f"Loaded {loaded_count} transformations from {csv_source} "
             f"(filtered out {filtered_count} of {total_count} total)"
         )
     else:
-        logging.info(f"Loaded {len(transformations)} transformations from {csv_path}")
+        logging.info(f"Loaded {loaded_count} transformations from {csv_source}")
+
+
+def load_transformations_from_csv(
+    csv_source: Union[str, TextIO],
+    filter_types: Optional[Collection[str]] = None
+) -> List[Dict]:
+    """
+    Load transformations from CSV file with optional type filtering.
 
-    return transformations
+    Args:
+        csv_source: Path to the transformations CSV file, or an open text stream
+        filter_types: Optional list or set of transformation types to include (None = all types)
+
+    Returns:
+        List of transformation dictionaries with parsed data
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist
+    """
+    return list(iter_transformations_from_csv(csv_source, filter_types))
 
 
 class Graph3DBuilder:
@@ -420,22 +928,40 @@ class Graph3DBuilder:
 
 
 def build_graph_from_csv(
-    csv_path: str,
+    csv_source: Union[str, TextIO],
     color_config: Dict[str, str],
-    filter_types: Optional[List[str]] = None
+    filter_types: Optional[Collection[str]] = None
 ) -> nx.DiGraph:
     """
     Build NetworkX graph from CSV data with optional type filtering.
 
     Args:
-        csv_path: Path to transformations CSV file
+        csv_source: Path to transformations CSV file, or an open text stream
+        color_config: Color configuration dictionary
+        filter_types: Optional list or set of transformation types to include
+
+    Returns:
+        NetworkX DiGraph with all transformations
+    """
+    # Stream rows into the builder instead of materializing the whole list
+    return build_graph(iter_transformations_from_csv(csv_source, filter_types), color_config)
+
+
+def build_graph(
+    transformations: Iterable[Dict],
+    color_config: Dict[str, str]
+) -> nx.DiGraph:
+    """
+    Build NetworkX graph from already parsed transformations.
+
+    Args:
+        transformations: Transformation dictionaries, as yielded by
+            iter_transformations_from_csv()
         color_config: Color configuration dictionary
-        filter_types: Optional list of transformation types to include
 
     Returns:
         NetworkX DiGraph with all transformations
     """
-    transformations = load_transformations_from_csv(csv_path, filter_types)
     builder = Graph3DBuilder()
 
     for trans in transformations:
@@ -551,7 +1077,8 @@ def render_3d_graph(
     edge_colors: List[str],
     color_config: Dict[str, str],
     use_images: bool = False,
-    images_dir: str = "images"
+    images_dir: str = "images",
+    image_cache: Optional[ImageCache] = None
 ) -> None:
     """
     Render the 3D graph using Matplotlib with hover annotations.
@@ -564,7 +1091,20 @@ def render_3d_graph(
         color_config: Color configuration dictionary
         use_images: Whether to use item images instead of spheres
         images_dir: Directory containing item images
+        image_cache: Cache to read and store item images in (default: a new ImageCache)
     """
+    # Start decoding item icons in the background while the figure is set up
+    if image_cache is None:
+        image_cache = ImageCache()
+    image_futures: Dict[str, Future] = {}
+    if use_images:
+        image_futures = prefetch_item_images(
+            (n for n, node_type in graph.nodes(data='node_type') if node_type == 'item'),
+            images_dir,
+            image_cache
+        )
+
+    _import_matplotlib()
     fig = plt.figure(figsize=(16, 12))
 
     # Create 3D axes with space for slider at the bottom
@@ -605,9 +1145,6 @@ def render_3d_graph(
             normalize=False  # Use actual vector length
         )
 
-    # Initialize image cache
-    image_cache: Dict[str, Optional[np.ndarray]] = {}
-
     # Plot item nodes (larger, colored or with images)
     item_scatter = None
     items_with_images = []
@@ -627,17 +1164,17 @@ def render_3d_graph(
         logging.info("Created interactive image size slider (0.5x - 2.0x, default: 1.0x)")
 
     if use_images and item_nodes:
-        # Try to load images for each item
+        # Collect the prefetched images, then read them from the cache
+        store_item_images(image_futures, image_cache)
         for node in item_nodes:
             img = load_item_image(node, images_dir, image_cache)
             if img is not None:
-                items_with_images.append(node)
+                items_with_images.append((node, img))
             else:
                 items_without_images.append(node)
 
         # Render items with images using AnnotationBbox approach
-        for node in items_with_images:
-            img = image_cache[node]
+        for node, img in items_with_images:
             x, y, z = pos[node]
 
             # Calculate zoom factor based on node size
@@ -848,8 +1385,8 @@ def render_3d_graph(
 
         def on_button_release(event):
             """Handle button release events to trigger redraw after interactions."""
-            # Trigger a redraw to update image positions after mouse interactions
-            fig.canvas.draw_idle()
+            # Redraw once a burst of mouse interactions has settled
+            _schedule_refresh(fig)
 
         fig.canvas.mpl_connect('button_release_event', on_button_release)
         logging.info("Draw, scroll, and interaction event handlers connected for image position updates")
@@ -871,13 +1408,33 @@ def render_3d_graph(
     logging.info("3D visualization rendered successfully with hover annotations")
 
 
+def _schedule_refresh(fig) -> None:
+    """
+    Redraw the figure once interactions pause for REFRESH_DEBOUNCE_MS.
+
+    Each call restarts a single-shot timer kept on the figure, so a burst of
+    events collapses into one redraw.
+
+    Args:
+        fig: Matplotlib figure to redraw
+    """
+    timer = getattr(fig, '_refresh_timer', None)
+    if timer is None:
+        timer = fig.canvas.new_timer(interval=REFRESH_DEBOUNCE_MS)
+        timer.single_shot = True
+        timer.add_callback(fig.canvas.draw_idle)
+        fig._refresh_timer = timer
+    timer.stop()
+    timer.start()
+
+
 def visualize_3d(
     csv_path: str,
     config_path: str,
     output_path: str = None,
     use_images: bool = False,
     images_dir: str = "images",
-    filter_types: Optional[List[str]] = None
+    filter_types: Optional[Collection[str]] = None
 ) -> None:
     """
     Generate interactive 3D visualization of transformation graph.
@@ -888,7 +1445,7 @@ def visualize_3d(
         output_path: Optional path to save figure (if None, only displays)
         use_images: Whether to use item images instead of spheres
         images_dir: Directory containing item images
-        filter_types: Optional list of transformation types to include
+        filter_types: Optional list or set of transformation types to include
     """
     # Load color configuration
     color_config = load_color_config(config_path)
@@ -909,14 +1466,27 @@ def visualize_3d(
     logging.info("Mapping edge colors...")
     edge_colors = get_edge_colors(graph, color_config)
 
+    # Restore icons decoded by earlier runs
+    image_cache = None
+    if use_images:
+        image_cache = DiskIconCache(images_dir)
+        image_cache.preload(
+            n for n, node_type in graph.nodes(data='node_type') if node_type == 'item'
+        )
+
     # Render the 3D visualization
     logging.info("Rendering 3D visualization...")
     render_3d_graph(
         graph, pos, node_sizes, edge_colors, color_config,
         use_images=use_images,
-        images_dir=images_dir
+        images_dir=images_dir,
+        image_cache=image_cache
     )
 
+    # Persist newly decoded icons for the next run
+    if image_cache is not None:
+        image_cache.save()
+
     # Save to file if output path provided
     if output_path:
         output_file = Path(output_path)
@@ -929,6 +1499,22 @@ def visualize_3d(
     plt.show()
 
 
+def _parse_filter_type(filter_type: str) -> FrozenSet[str]:
+    """
+    Parse the comma-separated --filter-type argument.
+
+    Returned as a frozenset so the CSV reader can use it for membership tests
+    as is, without building its own set.
+
+    Args:
+        filter_type: Value of --filter-type (e.g., "crafting,smelting")
+
+    Returns:
+        Set of transformation types to include
+    """
+    return frozenset(t.strip() for t in filter_type.split(','))
+
+
 def collect_options(args, csv_path: str) -> Dict:
     """
     Collect visualization options from CLI args and interactive fzf prompts.
@@ -950,7 +1536,7 @@ def collect_options(args, csv_path: str) -> Dict:
     if args.no_interactive:
         # Parse --filter-type if provided
         if args.filter_type:
-            options['filter_types'] = [t.strip() for t in args.filter_type.split(',')]
+            options['filter_types'] = _parse_filter_type(args.filter_type)
         logging.debug("Interactive mode disabled, using CLI arguments only")
         return options
 
@@ -973,7 +1559,7 @@ def collect_options(args, csv_path: str) -> Dict:
         options['filter_types'] = filter_types
     else:
         # Parse CLI filter-type argument
-        options['filter_types'] = [t.strip() for t in args.filter_type.split(',')]
+        options['filter_types'] = _parse_filter_type(args.filter_type)
         logging.debug("Using CLI filter-type, skipping interactive type prompt")
 
     return options
@@ -2,12 +2,26 @@
 
 import argparse
 import csv
-import json
+import functools
+import io
 import logging
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Union
 
 import graphviz
+from graphviz.quoting import quote
+
+# src/ is on sys.path when run as a script; the tests import through the
+# src package instead
+try:
+    from core.json_cells import decode_json_cell
+except ImportError:
+    from src.core.json_cells import decode_json_cell
 
 
 # Default color mappings if config file is missing or incomplete
@@ -25,117 +39,198 @@ DEFAULT_COLORS = {
     "grindstone": "#34495E",
 }
 
+# Shared read-only view returned when no config file is available
+DEFAULT_COLORS_VIEW = MappingProxyType(DEFAULT_COLORS)
+
+# "key=value" config line; comments, blank lines and lines missing a key or
+# value do not match
+COLOR_LINE_PATTERN = re.compile(r'^\s*([^#=\s][^=]*?)\s*=\s*(\S.*?)\s*$')
+
 
-def load_color_config(config_path: str) -> Dict[str, str]:
+def load_color_config(config_source: Union[str, TextIO]) -> Mapping[str, str]:
     """
     Load color configuration from file.
 
+    Results for paths are cached per path and modification time, so repeated
+    calls only re-read the file after it changes. Open text streams are parsed
+    directly.
+
     Args:
-        config_path: Path to the color configuration file
+        config_source: Path to the color configuration file, or an open text stream
+
+    Returns:
+        Read-only mapping of transformation types to color codes
+    """
+    if hasattr(config_source, 'read'):
+        return MappingProxyType(_parse_color_lines(config_source))
+
+    try:
+        mtime_ns = os.stat(config_source).st_mtime_ns
+    except OSError:
+        logging.warning(f"Config file not found at {config_source}, using default colors")
+        return DEFAULT_COLORS_VIEW
+
+    return _load_color_config_cached(str(config_source), mtime_ns)
+
+
+def _parse_color_lines(lines: Iterable[str]) -> Dict[str, str]:
+    """
+    Parse key=value color lines on top of the default colors.
+
+    Args:
+        lines: Lines of a color configuration file
 
     Returns:
         Dictionary mapping transformation types to color codes
     """
     colors = DEFAULT_COLORS.copy()
+    for line in lines:
+        match = COLOR_LINE_PATTERN.match(line)
+        if match:
+            colors[match.group(1)] = match.group(2)
+    return colors
+
 
-    config_file = Path(config_path)
-    if not config_file.exists():
-        logging.warning(f"Config file not found at {config_path}, using default colors")
-        return colors
+@functools.lru_cache(maxsize=32)
+def _load_color_config_cached(config_path: str, mtime_ns: int) -> Mapping[str, str]:
+    """
+    Parse a color configuration file (cached on path and modification time).
 
+    Args:
+        config_path: Path to the color configuration file
+        mtime_ns: Modification time of the file, used as part of the cache key
+
+    Returns:
+        Read-only mapping of transformation types to color codes
+    """
     try:
-        with open(config_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-
-                # Parse key=value format
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key and value:
-                        colors[key] = value
+        with open(config_path, 'r') as f:
+            colors = _parse_color_lines(f)
 
         logging.info(f"Loaded {len(colors)} color mappings from {config_path}")
     except Exception as e:
         logging.error(f"Error loading config file: {e}, using default colors")
+        return DEFAULT_COLORS_VIEW
 
-    return colors
+    # Read-only view so callers cannot mutate the cached copy
+    return MappingProxyType(colors)
 
 
-def load_transformations_from_csv(csv_path: str) -> List[Dict]:
+def iter_transformations_from_csv(csv_path: str) -> Iterator[Dict]:
     """
-    Load transformations from CSV file.
+    Stream transformations from CSV file one row at a time.
 
     Args:
         csv_path: Path to the transformations CSV file
 
-    Returns:
-        List of transformation dictionaries with parsed data
-    """
-    transformations = []
+    Yields:
+        Transformation dictionaries with parsed data
 
+    Raises:
+        FileNotFoundError: If the CSV file does not exist (on first iteration)
+    """
     csv_file = Path(csv_path)
     if not csv_file.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    loaded_count = 0
+
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        # Plain csv.reader with column indices resolved once from the header,
+        # avoiding the per-row dict built by csv.DictReader
+        reader = csv.reader(f)
+        header = next(reader, [])
+        try:
+            type_idx = header.index('transformation_type')
+            inputs_idx = header.index('input_items')
+            outputs_idx = header.index('output_items')
+            metadata_idx = header.index('metadata')
+        except ValueError as e:
+            logging.warning(f"Skipping CSV with missing column: {e}")
+            return
+
         for row in reader:
-            # Parse JSON arrays in input_items and output_items
+            if not row:
+                continue
+
+            # Parse JSON arrays in input_items and output_items, interning the
+            # item names since the same items recur across many transformations
             try:
-                inputs = json.loads(row['input_items'])
-                outputs = json.loads(row['output_items'])
-                metadata = json.loads(row['metadata'])
-
-                transformation = {
-                    'transformation_type': row['transformation_type'],
-                    'input_items': inputs,
-                    'output_items': outputs,
-                    'metadata': metadata
-                }
-                transformations.append(transformation)
-            except (json.JSONDecodeError, KeyError) as e:
+                trans_type = sys.intern(row[type_idx])
+                inputs = [sys.intern(item) for item in decode_json_cell(row[inputs_idx], list)]
+                outputs = [sys.intern(item) for item in decode_json_cell(row[outputs_idx], list)]
+                metadata = decode_json_cell(row[metadata_idx], dict)
+            except (ValueError, IndexError, TypeError) as e:
+                # ValueError covers the JSONDecodeError of json and orjson
                 logging.warning(f"Skipping malformed row: {e}")
                 continue
 
-    logging.info(f"Loaded {len(transformations)} transformations from {csv_path}")
-    return transformations
+            loaded_count += 1
+            yield {
+                'transformation_type': trans_type,
+                'input_items': inputs,
+                'output_items': outputs,
+                'metadata': metadata
+            }
+
+    logging.info(f"Loaded {loaded_count} transformations from {csv_path}")
+
+
+def load_transformations_from_csv(csv_path: str) -> List[Dict]:
+    """
+    Load transformations from CSV file.
+
+    Args:
+        csv_path: Path to the transformations CSV file
+
+    Returns:
+        List of transformation dictionaries with parsed data
+    """
+    return list(iter_transformations_from_csv(csv_path))
 
 
 class TransformationGraphBuilder:
     """Manages construction of transformation graphs using Graphviz."""
 
+    __slots__ = ('_dot', 'item_nodes', 'intermediate_counter')
+
     def __init__(self):
         """Initialize the graph builder."""
-        self.graph = graphviz.Digraph(
-            comment='Minecraft Transformations',
-            engine='dot',
-            format='svg'
-        )
+        # DOT source is written directly to a buffer; going through
+        # graphviz.Digraph's node()/edge() re-formats attributes on every call
+        self._dot = io.StringIO()
+        self._dot.write('// Minecraft Transformations\ndigraph {\n')
 
         # Set graph attributes for left-to-right layout
-        self.graph.attr(rankdir='LR')
-        self.graph.attr('node', shape='circle')
-        self.graph.attr('edge', arrowhead='normal')
+        self._dot.write('\trankdir=LR\n')
+        self._dot.write('\tnode [shape=circle]\n')
+        self._dot.write('\tedge [arrowhead=normal]\n')
 
-        # Track created nodes to avoid duplicates
-        self.item_nodes: Set[str] = set()
+        # Track created nodes (item name -> quoted DOT id) to avoid duplicates
+        self.item_nodes: Dict[str, str] = {}
         self.intermediate_counter = 0
 
-    def add_item_node(self, item_name: str) -> None:
+    @property
+    def source(self) -> str:
+        """DOT source of the graph built so far."""
+        return self._dot.getvalue() + '}\n'
+
+    def add_item_node(self, item_name: str) -> str:
         """
         Add an item node to the graph.
 
         Args:
             item_name: Name of the item
+
+        Returns:
+            Quoted DOT identifier of the node
         """
-        if item_name not in self.item_nodes:
-            self.graph.node(item_name, label=item_name, shape='circle')
-            self.item_nodes.add(item_name)
+        node_id = self.item_nodes.get(item_name)
+        if node_id is None:
+            node_id = quote(item_name)
+            self._dot.write(f'\t{node_id} [label={node_id} shape=circle]\n')
+            self.item_nodes[item_name] = node_id
+        return node_id
 
     def create_intermediate_node(self) -> str:
         """
@@ -148,9 +243,20 @@ class TransformationGraphBuilder:
         self.intermediate_counter += 1
 
         # Style as small dot
-        self.graph.node(node_id, label='', shape='point', width='0.1')
+        self._dot.write(f'\t{node_id} [label="" shape=point width=0.1]\n')
         return node_id
 
+    def add_edge(self, tail_id: str, head_id: str, color: str) -> None:
+        """
+        Add a colored edge between two existing nodes.
+
+        Args:
+            tail_id: DOT identifier of the source node
+            head_id: DOT identifier of the target node
+            color: Color for the edge
+        """
+        self._dot.write(f'\t{tail_id} -> {head_id} [color={quote(color)}]\n')
+
     def add_single_input_transformation(
         self,
         input_item: str,
@@ -165,9 +271,9 @@ class TransformationGraphBuilder:
             output_item: Name of the output item
             color: Color for the edge
         """
-        self.add_item_node(input_item)
-        self.add_item_node(output_item)
-        self.graph.edge(input_item, output_item, color=color)
+        input_id = self.add_item_node(input_item)
+        output_id = self.add_item_node(output_item)
+        self.add_edge(input_id, output_id, color)
 
     def add_multi_input_transformation(
         self,
@@ -188,17 +294,17 @@ class TransformationGraphBuilder:
 
         # Add edges from all inputs to intermediate
         for input_item in input_items:
-            self.add_item_node(input_item)
-            self.graph.edge(input_item, intermediate, color=color)
+            self.add_edge(self.add_item_node(input_item), intermediate, color)
 
         # Add edge from intermediate to output
-        self.add_item_node(output_item)
-        self.graph.edge(intermediate, output_item, color=color)
+        self.add_edge(intermediate, self.add_item_node(output_item), color)
 
     def render(self, output_path: str, formats: List[str]) -> List[str]:
         """
         Render the graph to files.
 
+        Each format is rendered by its own dot process, run concurrently.
+
         Args:
             output_path: Output file path without extension
             formats: List of output formats (svg, png, pdf, dot)
@@ -206,18 +312,39 @@ class TransformationGraphBuilder:
         Returns:
             List of created file paths
         """
-        created_files = []
+        if not formats:
+            return []
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+        source = self.source.encode('utf-8')
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = [
+                executor.submit(self._render_format, source, output_path, fmt)
+                for fmt in formats
+            ]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _render_format(source: bytes, output_path: str, fmt: str) -> str:
+        """
+        Render DOT source to a single output format.
 
-        for fmt in formats:
-            self.graph.format = fmt
-            output_file = self.graph.render(
-                filename=output_path,
-                cleanup=True  # Remove the intermediate .dot file
-            )
-            created_files.append(output_file)
-            logging.info(f"Generated graph: {output_file}")
+        Piping through dot avoids the intermediate source file that concurrent
+        renders to the same path would otherwise share.
 
-        return created_files
+        Args:
+            source: UTF-8 encoded DOT source
+            output_path: Output file path without extension
+            fmt: Output format
+
+        Returns:
+            Path of the created file
+        """
+        output_file = f"{output_path}.{fmt}"
+        Path(output_file).write_bytes(graphviz.pipe('dot', fmt, source))
+        logging.info(f"Generated graph: {output_file}")
+        return output_file
 
 
 def generate_graph(
@@ -242,20 +369,21 @@ def generate_graph(
     """
     # Load configuration and data
     colors = load_color_config(config_path)
-    transformations = load_transformations_from_csv(csv_path)
+    transformations = iter_transformations_from_csv(csv_path)
 
     # Filter by transformation type if specified
     if filter_type:
-        transformations = [
+        transformations = (
             t for t in transformations
             if t['transformation_type'] == filter_type
-        ]
-        logging.info(f"Filtered to {len(transformations)} {filter_type} transformations")
+        )
 
-    # Build graph
+    # Build graph, consuming the rows as they are read
     builder = TransformationGraphBuilder()
+    transformation_count = 0
 
     for trans in transformations:
+        transformation_count += 1
         trans_type = trans['transformation_type']
         inputs = trans['input_items']
         outputs = trans['output_items']
@@ -275,6 +403,13 @@ def generate_graph(
         else:
             builder.add_multi_input_transformation(inputs, output_item, color)
 
+    if filter_type:
+        logging.info(f"Filtered to {transformation_count} {filter_type} transformations")
+        if not transformation_count:
+            # Nothing to draw; skip spawning dot for an empty graph
+            logging.warning(f"No {filter_type} transformations found, no graph rendered")
+            return []
+
     # Create output directory if it doesn't exist
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
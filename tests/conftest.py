@@ -0,0 +1,50 @@
+"""Shared pytest configuration for the minegraph test suite."""
+
+import os
+import tempfile
+
+import pytest
+
+
+# Memory-backed filesystem used for temporary test files when available
+TMPFS_DIR = "/dev/shm"
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _tmpfs_tempdir():
+    """
+    Point the tempfile module at tmpfs for the whole test session.
+
+    Tests write many small CSV/config files through NamedTemporaryFile and
+    TemporaryDirectory; keeping them in memory avoids real disk I/O. Falls
+    back to the default temp directory when /dev/shm is not writable.
+    """
+    if not (os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK)):
+        yield
+        return
+
+    # tempfile caches the resolved directory, so set it directly rather than
+    # relying on TMPDIR being read again
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tempfile, "tempdir", TMPFS_DIR)
+        mp.setenv("TMPDIR", TMPFS_DIR)
+        yield
+
+
+@pytest.fixture(scope="session")
+def matplotlib_agg():
+    """
+    Select the non-interactive Agg backend once and warm up matplotlib.
+
+    Creating and closing a throwaway figure pays the font cache and backend
+    initialization cost up front instead of inside the first render test.
+    Only requested by the render tests, so runs that skip them never import
+    matplotlib.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    plt.close(plt.figure())
+    yield
+    plt.close("all")
@@ -191,3 +191,24 @@ class TestTransformation:
         # Should deduplicate to 1 unique output
         assert len(transformation.outputs) == 1
         assert transformation.outputs[0] == gold
+
+    def test_transformation_signature_is_cached(self):
+        """Test that get_signature returns the same cached tuple on repeated calls."""
+        iron = Item(name="Iron Ingot", url="https://minecraft.wiki/w/Iron_Ingot")
+        gold = Item(name="Gold Ingot", url="https://minecraft.wiki/w/Gold_Ingot")
+
+        transformation = Transformation(
+            transformation_type=TransformationType.CRAFTING,
+            inputs=[iron],
+            outputs=[gold],
+            metadata={"category": "tools"},
+        )
+
+        signature = transformation.get_signature()
+        assert signature == (
+            TransformationType.CRAFTING,
+            ("Iron Ingot",),
+            ("Gold Ingot",),
+            (("category", "tools"),),
+        )
+        assert transformation.get_signature() is signature
@@ -1,22 +1,40 @@
 """Tests for the Tool page crafting parser."""
 
+import functools
+
 import pytest
 from pathlib import Path
-from src.core.parsers import parse_tool_crafting
+from src.core.parsers import parse_tool_crafting, parse_tool_crafting_file
 from src.core.data_models import TransformationType
 
 
-def load_fixture(filename: str) -> str:
-    """Load HTML fixture file."""
-    fixture_path = Path(__file__).parent / "fixtures" / filename
-    with open(fixture_path, "r", encoding="utf-8") as f:
-        return f.read()
+TOOL_PAGE_PATH = Path(__file__).parent.parent / "ai_doc" / "downloaded_pages" / "tool.html"
+
+
+@functools.lru_cache(maxsize=None)
+def load_fixture(filename: str) -> bytes:
+    """Load raw HTML fixture bytes (cached, fixtures are read-only; lxml decodes them)."""
+    return (Path(__file__).parent / "fixtures" / filename).read_bytes()
+
 
+@pytest.fixture(scope="module")
+def tool_transformations():
+    """Transformations parsed once from the tool crafting sample fixture."""
+    return parse_tool_crafting(load_fixture("tool_crafting_sample.html"))
+
+
+@pytest.fixture(scope="session")
+def real_tool_page_transformations():
+    """Transformations parsed once from the real downloaded Tool page."""
+    if not TOOL_PAGE_PATH.exists():
+        pytest.skip("Tool page not downloaded yet")
 
-def test_parse_tool_crafting_basic():
+    return parse_tool_crafting_file(TOOL_PAGE_PATH)
+
+
+def test_parse_tool_crafting_basic(tool_transformations):
     """Test parsing a simple tool recipe without alternatives."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     # Find Flint and Steel transformation
     flint_and_steel = [t for t in transformations if any(item.name == "Flint and Steel" for item in t.outputs)]
@@ -37,10 +55,9 @@ def test_parse_tool_crafting_basic():
     assert t.outputs[0].name == "Flint and Steel"
 
 
-def test_parse_tool_crafting_animated_alternatives():
+def test_parse_tool_crafting_animated_alternatives(tool_transformations):
     """Test parsing stone hoe with 3 stone variants, should create 3 separate transformations."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     # Find all Stone Hoe transformations
     stone_hoe_recipes = [t for t in transformations if any(item.name == "Stone Hoe" for item in t.outputs)]
@@ -74,10 +91,9 @@ def test_parse_tool_crafting_animated_alternatives():
     assert stone_types == {"Cobblestone", "Blackstone", "Cobbled Deepslate"}
 
 
-def test_parse_tool_crafting_output_extraction():
+def test_parse_tool_crafting_output_extraction(tool_transformations):
     """Test that output item names are extracted correctly."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     output_names = {t.outputs[0].name for t in transformations}
 
@@ -87,10 +103,9 @@ def test_parse_tool_crafting_output_extraction():
     assert "Diamond Pickaxe" in output_names
 
 
-def test_parse_tool_crafting_input_extraction():
+def test_parse_tool_crafting_input_extraction(tool_transformations):
     """Test that all input ingredients are extracted correctly."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     # Find Diamond Pickaxe transformation
     diamond_pickaxe = [t for t in transformations if any(item.name == "Diamond Pickaxe" for item in t.outputs)]
@@ -104,10 +119,9 @@ def test_parse_tool_crafting_input_extraction():
     assert "Stick" in input_names, "Stick should be in inputs"
 
 
-def test_parse_tool_crafting_category_metadata():
+def test_parse_tool_crafting_category_metadata(tool_transformations):
     """Test that category field is populated in metadata."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     assert len(transformations) > 0, "Should have at least one transformation"
 
@@ -122,45 +136,34 @@ def test_parse_tool_crafting_category_metadata():
             assert isinstance(t.metadata["category"], str)
 
 
-def test_parse_tool_crafting_deduplication():
+def test_parse_tool_crafting_deduplication(tool_transformations):
     """Test that duplicate recipes are not added multiple times."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     # Check that there are no duplicate signatures
     signatures = [t.get_signature() for t in transformations]
     assert len(signatures) == len(set(signatures)), "Should not have duplicate transformations"
 
 
-def test_parse_tool_crafting_no_empty_inputs():
+def test_parse_tool_crafting_no_empty_inputs(tool_transformations):
     """Test that transformations don't have empty inputs."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     for t in transformations:
         assert len(t.inputs) > 0, "Transformation should have at least one input"
 
 
-def test_parse_tool_crafting_single_output():
+def test_parse_tool_crafting_single_output(tool_transformations):
     """Test that all transformations have exactly one output."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     for t in transformations:
         assert len(t.outputs) == 1, f"Transformation should have exactly one output, got {len(t.outputs)}"
 
 
-def test_parse_tool_crafting_real_page():
+def test_parse_tool_crafting_real_page(real_tool_page_transformations):
     """Test parsing the real downloaded Tool page."""
-    tool_page_path = Path(__file__).parent.parent / "ai_doc" / "downloaded_pages" / "tool.html"
-
-    if not tool_page_path.exists():
-        pytest.skip("Tool page not downloaded yet")
-
-    with open(tool_page_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
-
-    transformations = parse_tool_crafting(html_content)
+    transformations = real_tool_page_transformations
 
     # Should have extracted multiple tool recipes
     assert len(transformations) > 10, f"Expected more than 10 tool recipes, got {len(transformations)}"
@@ -174,10 +177,9 @@ def test_parse_tool_crafting_real_page():
     assert len(signatures) == len(set(signatures)), "Should not have duplicate transformations"
 
 
-def test_parse_tool_crafting_transformation_type():
+def test_parse_tool_crafting_transformation_type(tool_transformations):
     """Test that all transformations use CRAFTING type."""
-    html_content = load_fixture("tool_crafting_sample.html")
-    transformations = parse_tool_crafting(html_content)
+    transformations = tool_transformations
 
     for t in transformations:
         assert t.transformation_type == TransformationType.CRAFTING
@@ -1,7 +1,9 @@
 """Unit tests for graph visualization module."""
 
+import csv
+import io
 import json
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -19,24 +21,21 @@ class TestLoadColorConfig:
 
     def test_load_valid_config(self):
         """Test loading a valid configuration file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("# Comment line\n")
-            f.write("crafting=#4A90E2\n")
-            f.write("smelting=#E67E22\n")
-            f.write("\n")  # Empty line
-            f.write("brewing=#9B59B6\n")
-            temp_path = f.name
-
-        try:
-            colors = load_color_config(temp_path)
-            assert 'crafting' in colors
-            assert colors['crafting'] == '#4A90E2'
-            assert 'smelting' in colors
-            assert colors['smelting'] == '#E67E22'
-            assert 'brewing' in colors
-            assert colors['brewing'] == '#9B59B6'
-        finally:
-            Path(temp_path).unlink()
+        config = io.StringIO(
+            "# Comment line\n"
+            "crafting=#4A90E2\n"
+            "smelting=#E67E22\n"
+            "\n"  # Empty line
+            "brewing=#9B59B6\n"
+        )
+
+        colors = load_color_config(config)
+        assert 'crafting' in colors
+        assert colors['crafting'] == '#4A90E2'
+        assert 'smelting' in colors
+        assert colors['smelting'] == '#E67E22'
+        assert 'brewing' in colors
+        assert colors['brewing'] == '#9B59B6'
 
     def test_missing_config_file_uses_defaults(self):
         """Test that missing config file falls back to defaults."""
@@ -49,106 +48,134 @@ class TestLoadColorConfig:
 
     def test_malformed_lines_are_skipped(self):
         """Test that malformed lines are gracefully skipped."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("crafting=#4A90E2\n")
-            f.write("invalid_line_without_equals\n")
-            f.write("=no_key\n")
-            f.write("no_value=\n")
-            f.write("smelting=#E67E22\n")
-            temp_path = f.name
-
-        try:
-            colors = load_color_config(temp_path)
-            assert 'crafting' in colors
-            assert 'smelting' in colors
-        finally:
-            Path(temp_path).unlink()
+        config = io.StringIO(
+            "crafting=#4A90E2\n"
+            "invalid_line_without_equals\n"
+            "=no_key\n"
+            "no_value=\n"
+            "smelting=#E67E22\n"
+        )
+
+        colors = load_color_config(config)
+        assert 'crafting' in colors
+        assert 'smelting' in colors
 
     def test_comments_and_empty_lines_ignored(self):
         """Test that comments and empty lines are properly ignored."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("# This is a comment\n")
-            f.write("\n")
-            f.write("   \n")  # Whitespace only
-            f.write("# Another comment\n")
-            f.write("crafting=#4A90E2\n")
-            temp_path = f.name
-
-        try:
-            colors = load_color_config(temp_path)
-            assert 'crafting' in colors
-            assert colors['crafting'] == '#4A90E2'
-        finally:
-            Path(temp_path).unlink()
+        config = io.StringIO(
+            "# This is a comment\n"
+            "\n"
+            "   \n"  # Whitespace only
+            "# Another comment\n"
+            "crafting=#4A90E2\n"
+        )
+
+        colors = load_color_config(config)
+        assert 'crafting' in colors
+        assert colors['crafting'] == '#4A90E2'
+
+    def test_config_cached_until_file_changes(self, tmp_path):
+        """Test that the config is cached and reloaded once the file is modified."""
+        config_path = tmp_path / "colors.txt"
+        config_path.write_text("crafting=#111111\n")
+
+        colors = load_color_config(str(config_path))
+        assert load_color_config(str(config_path)) is colors
+        with pytest.raises(TypeError):
+            colors['crafting'] = '#000000'
+
+        config_path.write_text("crafting=#222222\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_color_config(str(config_path))['crafting'] == '#222222'
 
 
 class TestLoadTransformationsFromCSV:
     """Test cases for CSV transformation loading."""
 
-    def test_load_valid_csv(self):
+    def test_load_valid_csv(self, tmp_path):
         """Test loading a valid CSV with various transformation types."""
         csv_content = """transformation_type,input_items,output_items,metadata
 crafting,"[""Oak Planks""]","[""Crafting Table""]","{""source"":""test""}"
 smelting,"[""Iron Ore""]","[""Iron Ingot""]","{""fuel"":""coal""}"
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            transformations = load_transformations_from_csv(temp_path)
-            assert len(transformations) == 2
-
-            # Check first transformation
-            assert transformations[0]['transformation_type'] == 'crafting'
-            assert transformations[0]['input_items'] == ['Oak Planks']
-            assert transformations[0]['output_items'] == ['Crafting Table']
-            assert transformations[0]['metadata'] == {'source': 'test'}
-
-            # Check second transformation
-            assert transformations[1]['transformation_type'] == 'smelting'
-            assert transformations[1]['input_items'] == ['Iron Ore']
-            assert transformations[1]['output_items'] == ['Iron Ingot']
-            assert transformations[1]['metadata'] == {'fuel': 'coal'}
-        finally:
-            Path(temp_path).unlink()
-
-    def test_empty_csv(self):
+        csv_path = tmp_path / "transformations.csv"
+        csv_path.write_text(csv_content)
+
+        transformations = load_transformations_from_csv(str(csv_path))
+        assert len(transformations) == 2
+
+        # Check first transformation
+        assert transformations[0]['transformation_type'] == 'crafting'
+        assert transformations[0]['input_items'] == ['Oak Planks']
+        assert transformations[0]['output_items'] == ['Crafting Table']
+        assert transformations[0]['metadata'] == {'source': 'test'}
+
+        # Check second transformation
+        assert transformations[1]['transformation_type'] == 'smelting'
+        assert transformations[1]['input_items'] == ['Iron Ore']
+        assert transformations[1]['output_items'] == ['Iron Ingot']
+        assert transformations[1]['metadata'] == {'fuel': 'coal'}
+
+    def test_empty_csv(self, tmp_path):
         """Test loading an empty CSV file."""
         csv_content = """transformation_type,input_items,output_items,metadata
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        csv_path = tmp_path / "transformations.csv"
+        csv_path.write_text(csv_content)
 
-        try:
-            transformations = load_transformations_from_csv(temp_path)
-            assert len(transformations) == 0
-        finally:
-            Path(temp_path).unlink()
+        transformations = load_transformations_from_csv(str(csv_path))
+        assert len(transformations) == 0
 
     def test_missing_csv_raises_error(self):
         """Test that missing CSV file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             load_transformations_from_csv('/nonexistent/path/data.csv')
 
-    def test_malformed_json_rows_are_skipped(self):
+    def test_malformed_json_rows_are_skipped(self, tmp_path):
         """Test that rows with malformed JSON are skipped gracefully."""
         csv_content = """transformation_type,input_items,output_items,metadata
 crafting,"[""Oak Planks""]","[""Crafting Table""]","{""source"":""test""}"
 invalid,"invalid json","[""Item""]","{}"
 smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        csv_path = tmp_path / "transformations.csv"
+        csv_path.write_text(csv_content)
 
-        try:
-            transformations = load_transformations_from_csv(temp_path)
-            # Should load 2 valid rows, skip 1 invalid
-            assert len(transformations) == 2
-        finally:
-            Path(temp_path).unlink()
+        transformations = load_transformations_from_csv(str(csv_path))
+        # Should load 2 valid rows, skip 1 invalid
+        assert len(transformations) == 2
+
+    def test_split_json_cells_are_skipped(self, tmp_path):
+        """Test that JSON split across neighbouring cells is not stitched back together."""
+        csv_path = tmp_path / "transformations.csv"
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['transformation_type', 'input_items', 'output_items', 'metadata'])
+            writer.writerow(['crafting', '["A"', '["Out 1"]', '{}'])
+            writer.writerow(['crafting', '"B"]', '["Out 2"]', '{}'])
+            writer.writerow(['crafting', '"C","D"', '["Out 3"]', '{}'])
+            writer.writerow(['smelting', '["Iron Ore"]', '["Iron Ingot"]', '{}'])
+
+        transformations = load_transformations_from_csv(str(csv_path))
+
+        # The first three input cells only decode to one value each when joined
+        # together, so all three rows must be rejected
+        assert [t['input_items'] for t in transformations] == [['Iron Ore']]
+
+    def test_short_rows_are_skipped(self, tmp_path):
+        """Test that a row missing the trailing type column is skipped."""
+        csv_path = tmp_path / "transformations.csv"
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['input_items', 'output_items', 'metadata', 'transformation_type'])
+            writer.writerow(['["Oak Planks"]', '["Stick"]', '{}'])
+            writer.writerow(['["Iron Ore"]', '["Iron Ingot"]', '{}', 'smelting'])
+
+        transformations = load_transformations_from_csv(str(csv_path))
+
+        assert [t['transformation_type'] for t in transformations] == ['smelting']
 
 
 class TestTransformationGraphBuilder:
@@ -203,59 +230,66 @@ class TestTransformationGraphBuilder:
         assert "Iron Pickaxe" in builder.item_nodes
         assert builder.intermediate_counter == 1  # One intermediate node created
 
-    def test_render_creates_files(self):
+    def test_source_contains_quoted_nodes_and_edges(self):
+        """Test that the generated DOT source quotes item names and colors."""
+        builder = TransformationGraphBuilder()
+        builder.add_single_input_transformation("Iron Ore", "Iron Ingot", "#E67E22")
+
+        source = builder.source
+        assert source.startswith('// Minecraft Transformations\ndigraph {')
+        assert '"Iron Ore" [label="Iron Ore" shape=circle]' in source
+        assert '"Iron Ore" -> "Iron Ingot" [color="#E67E22"]' in source
+        assert source.endswith('}\n')
+
+    def test_render_creates_files(self, tmp_path):
         """Test that render creates output files."""
         builder = TransformationGraphBuilder()
         builder.add_single_input_transformation("Iron Ore", "Iron Ingot", "#E67E22")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = str(Path(temp_dir) / "test_graph")
-            created_files = builder.render(output_path, ['svg'])
+        created_files = builder.render(str(tmp_path / "test_graph"), ['svg'])
 
-            assert len(created_files) == 1
-            assert Path(created_files[0]).exists()
-            assert created_files[0].endswith('.svg')
+        assert len(created_files) == 1
+        assert Path(created_files[0]).exists()
+        assert created_files[0].endswith('.svg')
+
+
+def _generate(tmp_path, csv_content, config_content, formats, filter_type=None):
+    """Write the CSV and config contents to tmp_path and run generate_graph on them."""
+    csv_path = tmp_path / "test_transformations.csv"
+    csv_path.write_text(csv_content)
+    config_path = tmp_path / "test_config.txt"
+    config_path.write_text(config_content)
+
+    return generate_graph(
+        csv_path=str(csv_path),
+        config_path=str(config_path),
+        output_path=str(tmp_path / "test_graph"),
+        formats=formats,
+        filter_type=filter_type
+    )
 
 
 class TestGenerateGraph:
     """Test cases for the main generate_graph function."""
 
-    def test_generate_graph_integration(self):
+    def test_generate_graph_integration(self, tmp_path):
         """Integration test for generating a complete graph."""
-        # Create test CSV
         csv_content = """transformation_type,input_items,output_items,metadata
 crafting,"[""Oak Planks""]","[""Crafting Table""]","{}"
 crafting,"[""Iron Ingot"",""Stick""]","[""Iron Pickaxe""]","{}"
 smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
 """
-        # Create test config
         config_content = """crafting=#4A90E2
 smelting=#E67E22
 """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Write CSV
-            csv_path = Path(temp_dir) / "test_transformations.csv"
-            csv_path.write_text(csv_content)
-
-            # Write config
-            config_path = Path(temp_dir) / "test_config.txt"
-            config_path.write_text(config_content)
-
-            # Generate graph
-            output_path = str(Path(temp_dir) / "test_graph")
-            created_files = generate_graph(
-                csv_path=str(csv_path),
-                config_path=str(config_path),
-                output_path=output_path,
-                formats=['svg']
-            )
-
-            assert len(created_files) == 1
-            assert Path(created_files[0]).exists()
-            assert created_files[0].endswith('.svg')
-
-    def test_generate_graph_with_filter(self):
+        created_files = _generate(tmp_path, csv_content, config_content, ['svg'])
+
+        assert len(created_files) == 1
+        assert Path(created_files[0]).exists()
+        assert created_files[0].endswith('.svg')
+
+    def test_generate_graph_with_filter(self, tmp_path):
         """Test generating graph with transformation type filter."""
         csv_content = """transformation_type,input_items,output_items,metadata
 crafting,"[""Oak Planks""]","[""Crafting Table""]","{}"
@@ -266,26 +300,33 @@ crafting,"[""Iron Ingot""]","[""Iron Block""]","{}"
 smelting=#E67E22
 """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            csv_path = Path(temp_dir) / "test_transformations.csv"
-            csv_path.write_text(csv_content)
+        created_files = _generate(
+            tmp_path, csv_content, config_content, ['svg'], filter_type='crafting'
+        )
 
-            config_path = Path(temp_dir) / "test_config.txt"
-            config_path.write_text(config_content)
+        assert len(created_files) == 1
+        assert Path(created_files[0]).exists()
 
-            output_path = str(Path(temp_dir) / "test_graph")
-            created_files = generate_graph(
-                csv_path=str(csv_path),
-                config_path=str(config_path),
-                output_path=output_path,
-                formats=['svg'],
-                filter_type='crafting'
-            )
+    def test_generate_graph_with_empty_filter_result(self, tmp_path):
+        """Test that a filter matching no transformations renders nothing."""
+        csv_path = tmp_path / "test_transformations.csv"
+        csv_path.write_text("""transformation_type,input_items,output_items,metadata
+crafting,"[""Oak Planks""]","[""Crafting Table""]","{}"
+""")
+
+        output_path = tmp_path / "graphs" / "test_graph"
+        created_files = generate_graph(
+            csv_path=str(csv_path),
+            config_path=str(tmp_path / "missing_config.txt"),
+            output_path=str(output_path),
+            formats=['svg'],
+            filter_type='smelting'
+        )
 
-            assert len(created_files) == 1
-            assert Path(created_files[0]).exists()
+        assert created_files == []
+        assert not output_path.parent.exists()
 
-    def test_generate_graph_multiple_formats(self):
+    def test_generate_graph_multiple_formats(self, tmp_path):
         """Test generating graph in multiple formats."""
         csv_content = """transformation_type,input_items,output_items,metadata
 crafting,"[""Oak Planks""]","[""Crafting Table""]","{}"
@@ -293,23 +334,10 @@ crafting,"[""Oak Planks""]","[""Crafting Table""]","{}"
         config_content = """crafting=#4A90E2
 """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            csv_path = Path(temp_dir) / "test_transformations.csv"
-            csv_path.write_text(csv_content)
-
-            config_path = Path(temp_dir) / "test_config.txt"
-            config_path.write_text(config_content)
-
-            output_path = str(Path(temp_dir) / "test_graph")
-            created_files = generate_graph(
-                csv_path=str(csv_path),
-                config_path=str(config_path),
-                output_path=output_path,
-                formats=['svg', 'png']
-            )
-
-            assert len(created_files) == 2
-            svg_files = [f for f in created_files if f.endswith('.svg')]
-            png_files = [f for f in created_files if f.endswith('.png')]
-            assert len(svg_files) == 1
-            assert len(png_files) == 1
+        created_files = _generate(tmp_path, csv_content, config_content, ['svg', 'png'])
+
+        assert len(created_files) == 2
+        svg_files = [f for f in created_files if f.endswith('.svg')]
+        png_files = [f for f in created_files if f.endswith('.png')]
+        assert len(svg_files) == 1
+        assert len(png_files) == 1
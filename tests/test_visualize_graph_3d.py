@@ -1,55 +1,138 @@
 """Unit tests for 3D graph visualization module."""
 
+import csv
+import io
 import json
-import tempfile
+import os
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 from argparse import Namespace
 
-import pytest
 import networkx as nx
+import pytest
 
 from src.visualize_graph_3d import (
     Graph3DBuilder,
+    build_graph,
     build_graph_from_csv,
     calculate_node_sizes,
     collect_options,
     compute_3d_layout,
     get_edge_colors,
+    iter_transformations_from_csv,
     load_color_config,
-    load_item_image,
     load_transformation_types,
     load_transformations_from_csv,
     prompt_boolean_options,
     prompt_transformation_types,
-    render_3d_graph,
-    standardize_filename,
 )
 
 
+CSV_HEADER = ('transformation_type', 'input_items', 'output_items', 'metadata')
+
+
+def _make_csv(*rows) -> str:
+    """
+    Build transformation CSV text from (type, inputs, outputs[, metadata]) tuples.
+
+    The JSON columns are encoded with json.dumps and quoted by csv.writer, so
+    tests never hand-escape the nested quotes.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(CSV_HEADER)
+    writer.writerows(
+        (trans_type, json.dumps(inputs), json.dumps(outputs), json.dumps(metadata[0] if metadata else {}))
+        for trans_type, inputs, outputs, *metadata in rows
+    )
+    return buf.getvalue()
+
+
+# CSV corpora shared by several tests; the path fixtures below write them to disk
+# once per module for the prompts, which only accept file paths
+MIXED_TYPES_CSV = _make_csv(
+    ("crafting", ["Oak Planks"], ["Stick"]),
+    ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+    ("crafting", ["Stick"], ["Tool"]),
+    ("brewing", ["Water Bottle"], ["Potion"]),
+)
+
+THREE_TYPES_CSV = _make_csv(
+    ("crafting", ["Oak Planks"], ["Stick"]),
+    ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+    ("brewing", ["Water Bottle"], ["Potion"]),
+)
+
+SINGLE_CRAFTING_CSV = _make_csv(
+    ("crafting", ["Oak Planks"], ["Stick"]),
+)
+
+
+def _write_module_csv(tmp_path_factory, content: str) -> str:
+    """Write CSV content to a module-lifetime temp file and return its path."""
+    csv_path = tmp_path_factory.mktemp("csv") / "transformations.csv"
+    csv_path.write_text(content)
+    return str(csv_path)
+
+
+@pytest.fixture(scope="module")
+def default_color_config():
+    """Color config from the missing-file fallback, loaded once per module."""
+    return load_color_config('/nonexistent/path/config.txt')
+
+
+@pytest.fixture(scope="module")
+def three_types_csv(tmp_path_factory):
+    """Path to a CSV with one crafting, smelting and brewing row each."""
+    return _write_module_csv(tmp_path_factory, THREE_TYPES_CSV)
+
+
+@pytest.fixture(scope="module")
+def single_crafting_csv(tmp_path_factory):
+    """Path to a CSV with a single crafting row."""
+    return _write_module_csv(tmp_path_factory, SINGLE_CRAFTING_CSV)
+
+
 class TestLoadColorConfig:
     """Test cases for color configuration loading."""
 
-    def test_load_valid_config(self):
-        """Test loading a valid configuration file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("# Comment line\n")
-            f.write("crafting=#4A90E2\n")
-            f.write("smelting=#E67E22\n")
-            f.write("\n")  # Empty line
-            f.write("brewing=#9B59B6\n")
-            temp_path = f.name
-
-        try:
-            colors = load_color_config(temp_path)
-            assert 'crafting' in colors
-            assert colors['crafting'] == '#4A90E2'
-            assert 'smelting' in colors
-            assert colors['smelting'] == '#E67E22'
-            assert 'brewing' in colors
-            assert colors['brewing'] == '#9B59B6'
-        finally:
-            Path(temp_path).unlink()
+    @pytest.mark.parametrize("config_text,expected_colors", [
+        pytest.param(
+            "# Comment line\n"
+            "crafting=#4A90E2\n"
+            "smelting=#E67E22\n"
+            "\n"  # Empty line
+            "brewing=#9B59B6\n",
+            {'crafting': '#4A90E2', 'smelting': '#E67E22', 'brewing': '#9B59B6'},
+            id="valid_config",
+        ),
+        pytest.param(
+            "crafting=#4A90E2\n"
+            "invalid_line_without_equals\n"
+            "=no_key\n"
+            "no_value=\n"
+            "smelting=#E67E22\n",
+            {'crafting': '#4A90E2', 'smelting': '#E67E22'},
+            id="malformed_lines_skipped",
+        ),
+        pytest.param(
+            "# This is a comment\n"
+            "\n"
+            "   \n"  # Whitespace only
+            "# Another comment\n"
+            "crafting=#4A90E2\n",
+            {'crafting': '#4A90E2'},
+            id="comments_and_empty_lines_ignored",
+        ),
+    ])
+    def test_load_config(self, config_text, expected_colors):
+        """Test parsing configuration text into color mappings."""
+        colors = load_color_config(io.StringIO(config_text))
+
+        for trans_type, color in expected_colors.items():
+            assert colors[trans_type] == color
 
     def test_missing_config_file_uses_defaults(self):
         """Test that missing config file falls back to defaults."""
@@ -60,127 +143,95 @@ class TestLoadColorConfig:
         assert 'brewing' in colors
         assert len(colors) > 0
 
-    def test_malformed_lines_are_skipped(self):
-        """Test that malformed lines are gracefully skipped."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("crafting=#4A90E2\n")
-            f.write("invalid_line_without_equals\n")
-            f.write("=no_key\n")
-            f.write("no_value=\n")
-            f.write("smelting=#E67E22\n")
-            temp_path = f.name
-
-        try:
-            colors = load_color_config(temp_path)
-            assert 'crafting' in colors
-            assert 'smelting' in colors
-        finally:
-            Path(temp_path).unlink()
-
-    def test_comments_and_empty_lines_ignored(self):
-        """Test that comments and empty lines are properly ignored."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("# This is a comment\n")
-            f.write("\n")
-            f.write("   \n")  # Whitespace only
-            f.write("# Another comment\n")
-            f.write("crafting=#4A90E2\n")
-            temp_path = f.name
-
-        try:
-            colors = load_color_config(temp_path)
-            assert 'crafting' in colors
-            assert colors['crafting'] == '#4A90E2'
-        finally:
-            Path(temp_path).unlink()
-
 
 class TestLoadTransformationsFromCSV:
     """Test cases for CSV transformation loading."""
 
-    def test_load_valid_csv(self):
-        """Test loading a valid CSV with various transformation types."""
-        csv_content = """transformation_type,input_items,output_items,metadata
+    @pytest.mark.parametrize("csv_text,expected", [
+        pytest.param(
+            _make_csv(
+                ("crafting", ["Oak Planks"], ["Crafting Table"], {"source": "test"}),
+                ("smelting", ["Iron Ore"], ["Iron Ingot"], {"fuel": "coal"}),
+            ),
+            [
+                {'transformation_type': 'crafting', 'input_items': ['Oak Planks'],
+                 'output_items': ['Crafting Table'], 'metadata': {'source': 'test'}},
+                {'transformation_type': 'smelting', 'input_items': ['Iron Ore'],
+                 'output_items': ['Iron Ingot'], 'metadata': {'fuel': 'coal'}},
+            ],
+            id="valid_csv",
+        ),
+        pytest.param(
+            _make_csv(),
+            [],
+            id="empty_csv",
+        ),
+        pytest.param(
+            """transformation_type,input_items,output_items,metadata
 crafting,"[""Oak Planks""]","[""Crafting Table""]","{""source"":""test""}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{""fuel"":""coal""}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            transformations = load_transformations_from_csv(temp_path)
-            assert len(transformations) == 2
-
-            # Check first transformation
-            assert transformations[0]['transformation_type'] == 'crafting'
-            assert transformations[0]['input_items'] == ['Oak Planks']
-            assert transformations[0]['output_items'] == ['Crafting Table']
-            assert transformations[0]['metadata'] == {'source': 'test'}
-
-            # Check second transformation
-            assert transformations[1]['transformation_type'] == 'smelting'
-            assert transformations[1]['input_items'] == ['Iron Ore']
-            assert transformations[1]['output_items'] == ['Iron Ingot']
-            assert transformations[1]['metadata'] == {'fuel': 'coal'}
-        finally:
-            Path(temp_path).unlink()
-
-    def test_load_empty_csv(self):
-        """Test loading an empty CSV file."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            transformations = load_transformations_from_csv(temp_path)
-            assert len(transformations) == 0
-        finally:
-            Path(temp_path).unlink()
+invalid,bad_json,"[""Output""]","{}"
+smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
+""",
+            [
+                {'transformation_type': 'crafting', 'input_items': ['Oak Planks'],
+                 'output_items': ['Crafting Table'], 'metadata': {'source': 'test'}},
+                {'transformation_type': 'smelting', 'input_items': ['Iron Ore'],
+                 'output_items': ['Iron Ingot'], 'metadata': {}},
+            ],
+            id="malformed_rows_skipped",
+        ),
+        pytest.param(
+            # Input cells ["A" / "B"] / "C","D" only decode to one value per row
+            # when joined together, so all three rows are rejected
+            'transformation_type,input_items,output_items,metadata\n'
+            'crafting,"[""A""","[""Out 1""]",{}\n'
+            'crafting,"""B""]","[""Out 2""]",{}\n'
+            'crafting,"""C"",""D""","[""Out 3""]",{}\n'
+            'smelting,"[""Iron Ore""]","[""Iron Ingot""]",{}\n',
+            [
+                {'transformation_type': 'smelting', 'input_items': ['Iron Ore'],
+                 'output_items': ['Iron Ingot'], 'metadata': {}},
+            ],
+            id="split_json_cells_skipped",
+        ),
+        pytest.param(
+            'input_items,output_items,metadata,transformation_type\n'
+            '"[""Oak Planks""]","[""Stick""]",{}\n'
+            '"[""Iron Ore""]","[""Iron Ingot""]",{},smelting\n',
+            [
+                {'transformation_type': 'smelting', 'input_items': ['Iron Ore'],
+                 'output_items': ['Iron Ingot'], 'metadata': {}},
+            ],
+            id="short_row_skipped",
+        ),
+        pytest.param(
+            _make_csv(
+                ("crafting", ["Oak Planks", "Iron Ingot"], ["Door"]),
+            ),
+            [
+                {'transformation_type': 'crafting', 'input_items': ['Oak Planks', 'Iron Ingot'],
+                 'output_items': ['Door'], 'metadata': {}},
+            ],
+            id="multi_input_transformation",
+        ),
+    ])
+    def test_load_csv(self, csv_text, expected):
+        """Test loading transformations from CSV text."""
+        transformations = load_transformations_from_csv(io.StringIO(csv_text))
+        assert transformations == expected
 
     def test_missing_csv_file_raises_error(self):
         """Test that missing CSV file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             load_transformations_from_csv('/nonexistent/path/transformations.csv')
 
-    def test_malformed_rows_are_skipped(self):
-        """Test that malformed rows are gracefully skipped."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Crafting Table""]","{""source"":""test""}"
-invalid,bad_json,"[""Output""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            transformations = load_transformations_from_csv(temp_path)
-            # Should skip the malformed row
-            assert len(transformations) == 2
-            assert transformations[0]['transformation_type'] == 'crafting'
-            assert transformations[1]['transformation_type'] == 'smelting'
-        finally:
-            Path(temp_path).unlink()
-
-    def test_multi_input_transformation(self):
-        """Test loading transformation with multiple inputs."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks"", ""Iron Ingot""]","[""Door""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            transformations = load_transformations_from_csv(temp_path)
-            assert len(transformations) == 1
-            assert len(transformations[0]['input_items']) == 2
-            assert transformations[0]['input_items'] == ['Oak Planks', 'Iron Ingot']
-        finally:
-            Path(temp_path).unlink()
+
+@pytest.fixture(scope="class")
+def multi_input_builder():
+    """Builder holding a single two-input transformation, shared by read-only tests."""
+    builder = Graph3DBuilder()
+    builder.add_multi_input_transformation(['Oak Planks', 'Iron Ingot'], 'Door', 'crafting')
+    return builder
 
 
 class TestGraph3DBuilder:
@@ -243,35 +294,40 @@ class TestGraph3DBuilder:
         assert builder.graph.has_edge('Iron Ore', 'Iron Ingot')
         assert builder.graph.edges['Iron Ore', 'Iron Ingot']['transformation_type'] == 'smelting'
 
-    def test_add_multi_input_transformation(self):
+    def test_add_multi_input_transformation(self, multi_input_builder):
         """Test adding multi-input transformation with intermediate node."""
-        builder = Graph3DBuilder()
-        inputs = ['Oak Planks', 'Iron Ingot']
-        output = 'Door'
-        builder.add_multi_input_transformation(inputs, output, 'crafting')
+        graph = multi_input_builder.graph
 
         # Should have 2 input nodes + 1 intermediate + 1 output = 4 nodes
-        assert builder.graph.number_of_nodes() == 4
+        assert graph.number_of_nodes() == 4
 
         # Should have 2 edges from inputs to intermediate + 1 edge from intermediate to output = 3 edges
-        assert builder.graph.number_of_edges() == 3
+        assert graph.number_of_edges() == 3
+
+    def test_multi_input_edges_route_through_intermediate(self, multi_input_builder):
+        """Test that all inputs connect to the output through one intermediate node."""
+        graph = multi_input_builder.graph
 
         # Find the intermediate node
         intermediate_nodes = [
-            n for n in builder.graph.nodes()
-            if builder.graph.nodes[n].get('node_type') == 'intermediate'
+            n for n in graph.nodes()
+            if graph.nodes[n].get('node_type') == 'intermediate'
         ]
         assert len(intermediate_nodes) == 1
         intermediate = intermediate_nodes[0]
 
         # Verify edges
-        assert builder.graph.has_edge('Oak Planks', intermediate)
-        assert builder.graph.has_edge('Iron Ingot', intermediate)
-        assert builder.graph.has_edge(intermediate, 'Door')
+        assert graph.has_edge('Oak Planks', intermediate)
+        assert graph.has_edge('Iron Ingot', intermediate)
+        assert graph.has_edge(intermediate, 'Door')
+
+    def test_multi_input_edges_share_transformation_type(self, multi_input_builder):
+        """Test that every edge of a multi-input transformation carries its type."""
+        graph = multi_input_builder.graph
 
         # Verify all edges have correct transformation type
-        for u, v in builder.graph.edges():
-            assert builder.graph.edges[u, v]['transformation_type'] == 'crafting'
+        for u, v in graph.edges():
+            assert graph.edges[u, v]['transformation_type'] == 'crafting'
 
     def test_multiple_transformations(self):
         """Test adding multiple transformations creates correct graph structure."""
@@ -309,91 +365,92 @@ class TestBuildGraphFromCSV:
 
     def test_build_graph_single_input_transformations(self):
         """Test building graph with only single-input transformations."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Crafting Table""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            color_config = {'crafting': '#4A90E2', 'smelting': '#E67E22'}
-            graph = build_graph_from_csv(temp_path, color_config)
-
-            # Should have 4 item nodes (no intermediates)
-            assert graph.number_of_nodes() == 4
-            assert graph.number_of_edges() == 2
-
-            # Verify nodes
-            assert graph.has_node('Oak Planks')
-            assert graph.has_node('Crafting Table')
-            assert graph.has_node('Iron Ore')
-            assert graph.has_node('Iron Ingot')
-
-            # Verify edges
-            assert graph.has_edge('Oak Planks', 'Crafting Table')
-            assert graph.has_edge('Iron Ore', 'Iron Ingot')
-        finally:
-            Path(temp_path).unlink()
+        csv_content = _make_csv(
+            ("crafting", ["Oak Planks"], ["Crafting Table"]),
+            ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+        )
+        csv_source = io.StringIO(csv_content)
+
+        color_config = {'crafting': '#4A90E2', 'smelting': '#E67E22'}
+        graph = build_graph_from_csv(csv_source, color_config)
+
+        # Should have 4 item nodes (no intermediates)
+        assert graph.number_of_nodes() == 4
+        assert graph.number_of_edges() == 2
+
+        # Verify nodes
+        assert graph.has_node('Oak Planks')
+        assert graph.has_node('Crafting Table')
+        assert graph.has_node('Iron Ore')
+        assert graph.has_node('Iron Ingot')
+
+        # Verify edges
+        assert graph.has_edge('Oak Planks', 'Crafting Table')
+        assert graph.has_edge('Iron Ore', 'Iron Ingot')
 
     def test_build_graph_multi_input_transformations(self):
         """Test building graph with multi-input transformations."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks"", ""Iron Ingot""]","[""Door""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            color_config = {'crafting': '#4A90E2'}
-            graph = build_graph_from_csv(temp_path, color_config)
-
-            # Should have 2 inputs + 1 intermediate + 1 output = 4 nodes
-            assert graph.number_of_nodes() == 4
-
-            # Should have 2 edges to intermediate + 1 edge from intermediate = 3 edges
-            assert graph.number_of_edges() == 3
-
-            # Find intermediate node
-            intermediate_nodes = [
-                n for n in graph.nodes()
-                if graph.nodes[n].get('node_type') == 'intermediate'
-            ]
-            assert len(intermediate_nodes) == 1
-        finally:
-            Path(temp_path).unlink()
+        csv_content = _make_csv(
+            ("crafting", ["Oak Planks", "Iron Ingot"], ["Door"]),
+        )
+        csv_source = io.StringIO(csv_content)
 
-    def test_build_graph_mixed_transformations(self):
-        """Test building graph with mix of single and multi-input transformations."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-crafting,"[""Stick"", ""Iron Ingot""]","[""Iron Sword""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        color_config = {'crafting': '#4A90E2'}
+        graph = build_graph_from_csv(csv_source, color_config)
 
-        try:
-            color_config = {'crafting': '#4A90E2', 'smelting': '#E67E22'}
-            graph = build_graph_from_csv(temp_path, color_config)
+        # Should have 2 inputs + 1 intermediate + 1 output = 4 nodes
+        assert graph.number_of_nodes() == 4
 
-            # Should have: Oak Planks, Stick, Iron Ingot, Iron Sword, Iron Ore + 1 intermediate = 6 nodes
-            assert graph.number_of_nodes() == 6
+        # Should have 2 edges to intermediate + 1 edge from intermediate = 3 edges
+        assert graph.number_of_edges() == 3
 
-            # 2 single-input edges + 3 multi-input edges = 5 edges
-            assert graph.number_of_edges() == 5
+        # Find intermediate node
+        intermediate_nodes = [
+            n for n in graph.nodes()
+            if graph.nodes[n].get('node_type') == 'intermediate'
+        ]
+        assert len(intermediate_nodes) == 1
+
+    def test_build_graph_mixed_transformations(self):
+        """Test building graph with mix of single and multi-input transformations."""
+        csv_content = _make_csv(
+            ("crafting", ["Oak Planks"], ["Stick"]),
+            ("crafting", ["Stick", "Iron Ingot"], ["Iron Sword"]),
+            ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+        )
+        csv_source = io.StringIO(csv_content)
+
+        color_config = {'crafting': '#4A90E2', 'smelting': '#E67E22'}
+        graph = build_graph_from_csv(csv_source, color_config)
+
+        # Should have: Oak Planks, Stick, Iron Ingot, Iron Sword, Iron Ore + 1 intermediate = 6 nodes
+        assert graph.number_of_nodes() == 6
+
+        # 2 single-input edges + 3 multi-input edges = 5 edges
+        assert graph.number_of_edges() == 5
+
+        # Verify item nodes
+        assert graph.has_node('Oak Planks')
+        assert graph.has_node('Stick')
+        assert graph.has_node('Iron Ingot')
+        assert graph.has_node('Iron Sword')
+        assert graph.has_node('Iron Ore')
+
+    def test_build_graph_from_iter(self):
+        """Test building graph from already parsed transformations."""
+        transformations = [
+            {'transformation_type': 'crafting', 'input_items': ['Oak Planks'],
+             'output_items': ['Stick'], 'metadata': {}},
+            {'transformation_type': 'crafting', 'input_items': ['Stick', 'Iron Ingot'],
+             'output_items': ['Iron Sword'], 'metadata': {}},
+        ]
 
-            # Verify item nodes
-            assert graph.has_node('Oak Planks')
-            assert graph.has_node('Stick')
-            assert graph.has_node('Iron Ingot')
-            assert graph.has_node('Iron Sword')
-            assert graph.has_node('Iron Ore')
-        finally:
-            Path(temp_path).unlink()
+        graph = build_graph(transformations, {'crafting': '#4A90E2'})
+
+        # Oak Planks, Stick, Iron Ingot, Iron Sword + 1 intermediate = 5 nodes
+        assert graph.number_of_nodes() == 5
+        assert graph.number_of_edges() == 4
+        assert graph.has_edge('Oak Planks', 'Stick')
 
 
 class TestCompute3DLayout:
@@ -443,61 +500,63 @@ class TestCompute3DLayout:
             assert len(pos[node]) == 3
 
 
-class TestCalculateNodeSizes:
-    """Test cases for node size calculation."""
+def _make_graph(nodes, edges):
+    """Build a DiGraph from (name, node_type) pairs and edges, with all nodes at the origin."""
+    graph = nx.DiGraph()
+    graph.add_nodes_from((name, {'node_type': node_type}) for name, node_type in nodes)
+    graph.add_edges_from(edges)
+    return graph, dict.fromkeys(graph.nodes(), (0, 0, 0))
 
-    def test_calculate_sizes_single_node(self):
-        """Test size calculation with single node."""
-        graph = nx.DiGraph()
-        graph.add_node('A', node_type='item')
 
-        pos = {'A': (0, 0, 0)}
-        sizes = calculate_node_sizes(graph, pos)
+def _single_node_graph():
+    return _make_graph([('A', 'item')], [])
 
-        assert 'A' in sizes
-        # Single node should have some size
-        assert sizes['A'] > 0
 
-    def test_calculate_sizes_intermediate_nodes_smaller(self):
-        """Test that intermediate nodes get smaller sizes."""
-        graph = nx.DiGraph()
-        graph.add_node('Item1', node_type='item')
-        graph.add_node('Item2', node_type='item')
-        graph.add_node('intermediate_0', node_type='intermediate')
-        graph.add_edge('Item1', 'intermediate_0')
-        graph.add_edge('intermediate_0', 'Item2')
+def _intermediate_graph():
+    return _make_graph(
+        [('Item1', 'item'), ('Item2', 'item'), ('intermediate_0', 'intermediate')],
+        [('Item1', 'intermediate_0'), ('intermediate_0', 'Item2')],
+    )
 
-        pos = {'Item1': (0, 0, 0), 'intermediate_0': (1, 1, 1), 'Item2': (2, 2, 2)}
-        sizes = calculate_node_sizes(graph, pos)
 
-        # Intermediate node should be smaller
-        assert sizes['intermediate_0'] < sizes['Item1']
-        assert sizes['intermediate_0'] < sizes['Item2']
-        assert sizes['intermediate_0'] == 15  # Fixed size for intermediate
+def _hub_graph():
+    # Hub has high degree, A has low degree
+    return _make_graph(
+        [('Hub', 'item'), ('A', 'item'), ('B', 'item'), ('C', 'item')],
+        [('Hub', 'A'), ('Hub', 'B'), ('Hub', 'C'), ('A', 'B')],
+    )
 
-    def test_calculate_sizes_based_on_degree(self):
-        """Test that node sizes vary based on degree centrality."""
-        graph = nx.DiGraph()
-        # Create a hub node with many connections
-        graph.add_node('Hub', node_type='item')
-        graph.add_node('A', node_type='item')
-        graph.add_node('B', node_type='item')
-        graph.add_node('C', node_type='item')
-
-        # Hub has high degree
-        graph.add_edge('Hub', 'A')
-        graph.add_edge('Hub', 'B')
-        graph.add_edge('Hub', 'C')
-
-        # A has low degree
-        graph.add_edge('A', 'B')
 
-        pos = {n: (0, 0, 0) for n in graph.nodes()}
-        sizes = calculate_node_sizes(graph, pos)
+def _check_single_node(sizes):
+    # Single node should have some size
+    assert 'A' in sizes
+    assert sizes['A'] > 0
+
 
-        # Hub should have larger size due to higher degree
-        assert sizes['Hub'] >= sizes['A']
-        assert sizes['Hub'] >= sizes['B']
+def _check_intermediate_smaller(sizes):
+    assert sizes['intermediate_0'] < sizes['Item1']
+    assert sizes['intermediate_0'] < sizes['Item2']
+    assert sizes['intermediate_0'] == 15  # Fixed size for intermediate
+
+
+def _check_hub_larger(sizes):
+    # Hub should have larger size due to higher degree
+    assert sizes['Hub'] >= sizes['A']
+    assert sizes['Hub'] >= sizes['B']
+
+
+class TestCalculateNodeSizes:
+    """Test cases for node size calculation."""
+
+    @pytest.mark.parametrize("make_graph,check", [
+        pytest.param(_single_node_graph, _check_single_node, id="single_node"),
+        pytest.param(_intermediate_graph, _check_intermediate_smaller, id="intermediate_nodes_smaller"),
+        pytest.param(_hub_graph, _check_hub_larger, id="based_on_degree"),
+    ])
+    def test_calculate_sizes(self, make_graph, check):
+        """Test node sizes for item, intermediate and hub nodes."""
+        graph, pos = make_graph()
+        check(calculate_node_sizes(graph, pos))
 
 
 class TestGetEdgeColors:
@@ -548,429 +607,84 @@ class TestGetEdgeColors:
 class TestIntegration:
     """Integration tests for end-to-end functionality."""
 
-    def test_full_pipeline_simple(self):
+    def test_full_pipeline_simple(self, default_color_config):
         """Test complete pipeline with simple transformation data."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            # Load color config
-            color_config = load_color_config('/nonexistent/path/config.txt')
-
-            # Build graph
-            graph = build_graph_from_csv(temp_path, color_config)
+        csv_content = _make_csv(
+            ("crafting", ["Oak Planks"], ["Stick"]),
+            ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+        )
+        csv_source = io.StringIO(csv_content)
 
-            # Compute layout
-            pos = compute_3d_layout(graph)
+        # Build graph
+        graph = build_graph_from_csv(csv_source, default_color_config)
 
-            # Calculate sizes
-            sizes = calculate_node_sizes(graph, pos)
+        # Compute layout
+        pos = compute_3d_layout(graph)
 
-            # Get colors
-            colors = get_edge_colors(graph, color_config)
+        # Calculate sizes
+        sizes = calculate_node_sizes(graph, pos)
 
-            # Verify results
-            assert graph.number_of_nodes() == 4
-            assert graph.number_of_edges() == 2
-            assert len(pos) == 4
-            assert len(sizes) == 4
-            assert len(colors) == 2
+        # Get colors
+        colors = get_edge_colors(graph, default_color_config)
 
-            # Verify all nodes have 3D positions
-            for node in graph.nodes():
-                assert node in pos
-                assert len(pos[node]) == 3
+        # Verify results
+        assert graph.number_of_nodes() == 4
+        assert graph.number_of_edges() == 2
+        assert len(pos) == 4
+        assert len(sizes) == 4
+        assert len(colors) == 2
 
-            # Verify all nodes have sizes
-            for node in graph.nodes():
-                assert node in sizes
-                assert sizes[node] > 0
+        # Verify all nodes have 3D positions
+        for node in graph.nodes():
+            assert node in pos
+            assert len(pos[node]) == 3
 
-        finally:
-            Path(temp_path).unlink()
+        # Verify all nodes have sizes
+        for node in graph.nodes():
+            assert node in sizes
+            assert sizes[node] > 0
 
-    def test_full_pipeline_complex(self):
+    def test_full_pipeline_complex(self, default_color_config, tmp_path):
         """Test complete pipeline with complex transformation data."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-crafting,"[""Stick"", ""Iron Ingot""]","[""Iron Sword""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-crafting,"[""Oak Planks""]","[""Crafting Table""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            # Load color config
-            color_config = load_color_config('/nonexistent/path/config.txt')
-
-            # Build graph
-            graph = build_graph_from_csv(temp_path, color_config)
-
-            # Compute layout
-            pos = compute_3d_layout(graph)
-
-            # Calculate sizes
-            sizes = calculate_node_sizes(graph, pos)
-
-            # Get colors
-            colors = get_edge_colors(graph, color_config)
-
-            # Verify results
-            assert graph.number_of_nodes() > 0
-            assert graph.number_of_edges() > 0
-            assert len(pos) == graph.number_of_nodes()
-            assert len(sizes) == graph.number_of_nodes()
-            assert len(colors) == graph.number_of_edges()
-
-            # Find intermediate nodes
-            intermediate_nodes = [
-                n for n in graph.nodes()
-                if graph.nodes[n].get('node_type') == 'intermediate'
-            ]
-            assert len(intermediate_nodes) == 1  # One multi-input transformation
-
-            # Verify intermediate node has smaller size
-            for inter in intermediate_nodes:
-                assert sizes[inter] == 15
-
-        finally:
-            Path(temp_path).unlink()
-
-
-class TestRender3DGraph:
-    """Test cases for 3D graph rendering with hover annotations."""
-
-    def test_render_creates_event_handler(self):
-        """Test that render_3d_graph creates and connects hover event handler."""
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-interactive backend for testing
-        import matplotlib.pyplot as plt
-
-        # Create simple graph
-        graph = nx.DiGraph()
-        graph.add_node('Item1', node_type='item')
-        graph.add_node('Item2', node_type='item')
-        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
-
-        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
-        node_sizes = {'Item1': 50, 'Item2': 50}
-        edge_colors = ['#4A90E2']
-        color_config = {'crafting': '#4A90E2'}
-
-        # Render graph
-        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
-
-        # Get current figure
-        fig = plt.gcf()
-
-        # Check that motion_notify_event handler is connected
-        callbacks = fig.canvas.callbacks.callbacks.get('motion_notify_event', {})
-        assert len(callbacks) > 0, "No motion_notify_event handler connected"
-
-        plt.close(fig)
-
-    def test_render_with_empty_graph(self):
-        """Test rendering with empty graph doesn't crash."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        graph = nx.DiGraph()
-        pos = {}
-        node_sizes = {}
-        edge_colors = []
-        color_config = {}
-
-        # Should not raise any errors
-        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
-
-        fig = plt.gcf()
-        plt.close(fig)
-
-    def test_render_with_only_item_nodes(self):
-        """Test rendering with only item nodes (no intermediate nodes)."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        graph = nx.DiGraph()
-        graph.add_node('Item1', node_type='item')
-        graph.add_node('Item2', node_type='item')
-        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
-
-        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
-        node_sizes = {'Item1': 50, 'Item2': 50}
-        edge_colors = ['#4A90E2']
-        color_config = {'crafting': '#4A90E2'}
-
-        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
-
-        fig = plt.gcf()
-        ax = fig.axes[0]
-
-        # Check that axis ticks are not empty (numeric scales enabled)
-        # Note: Matplotlib may auto-generate ticks, so we check they exist
-        assert ax.get_xticks() is not None
-        assert ax.get_yticks() is not None
-        assert ax.get_zticks() is not None
-
-        plt.close(fig)
-
-    def test_render_with_intermediate_nodes(self):
-        """Test rendering with both item and intermediate nodes."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        graph = nx.DiGraph()
-        graph.add_node('Item1', node_type='item')
-        graph.add_node('Item2', node_type='item')
-        graph.add_node('intermediate_0', node_type='intermediate')
-        graph.add_node('Item3', node_type='item')
-        graph.add_edge('Item1', 'intermediate_0', transformation_type='crafting')
-        graph.add_edge('Item2', 'intermediate_0', transformation_type='crafting')
-        graph.add_edge('intermediate_0', 'Item3', transformation_type='crafting')
-
-        pos = {
-            'Item1': (0, 0, 0),
-            'Item2': (1, 0, 0),
-            'intermediate_0': (0.5, 0.5, 0.5),
-            'Item3': (0.5, 1, 1)
-        }
-        node_sizes = {'Item1': 50, 'Item2': 50, 'intermediate_0': 15, 'Item3': 50}
-        edge_colors = ['#4A90E2', '#4A90E2', '#4A90E2']
-        color_config = {'crafting': '#4A90E2'}
-
-        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
-
-        fig = plt.gcf()
-        plt.close(fig)
-
-    def test_render_with_large_graph(self):
-        """Test rendering performance with larger graph (simulating real use case)."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        # Create graph with 100 nodes
-        graph = nx.DiGraph()
-        for i in range(100):
-            graph.add_node(f'Item{i}', node_type='item')
-
-        # Add edges between sequential nodes
-        for i in range(99):
-            graph.add_edge(f'Item{i}', f'Item{i+1}', transformation_type='crafting')
-
-        # Create positions and sizes
-        pos = {f'Item{i}': (i % 10, i // 10, i % 5) for i in range(100)}
-        node_sizes = {f'Item{i}': 50 for i in range(100)}
-        edge_colors = ['#4A90E2'] * 99
-        color_config = {'crafting': '#4A90E2'}
-
-        # Should handle large graph without errors
-        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
-
-        fig = plt.gcf()
-
-        # Verify event handler is still connected
-        callbacks = fig.canvas.callbacks.callbacks.get('motion_notify_event', {})
-        assert len(callbacks) > 0
-
-        plt.close(fig)
-
-    def test_axis_scales_enabled(self):
-        """Test that numeric axis scales are enabled (ticks not removed)."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        graph = nx.DiGraph()
-        graph.add_node('Item1', node_type='item')
-        graph.add_node('Item2', node_type='item')
-        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
-
-        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
-        node_sizes = {'Item1': 50, 'Item2': 50}
-        edge_colors = ['#4A90E2']
-        color_config = {'crafting': '#4A90E2'}
-
-        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
-
-        fig = plt.gcf()
-        ax = fig.axes[0]
-
-        # Check that ticks exist (not explicitly set to empty)
-        # Matplotlib auto-generates ticks when not explicitly set to []
-        x_ticks = ax.get_xticks()
-        y_ticks = ax.get_yticks()
-        z_ticks = ax.get_zticks()
-
-        # Verify ticks are present (may be auto-generated)
-        assert x_ticks is not None
-        assert y_ticks is not None
-        assert z_ticks is not None
-
-        plt.close(fig)
-
-
-class TestImageFunctionality:
-    """Test cases for image loading and rendering functionality."""
-
-    def test_standardize_filename_basic(self):
-        """Test basic filename standardization."""
-        assert standardize_filename("Iron Ingot") == "iron_ingot.png"
-        assert standardize_filename("Oak Planks") == "oak_planks.png"
-
-    def test_standardize_filename_special_chars(self):
-        """Test filename standardization with special characters."""
-        assert standardize_filename("Iron-Ingot!") == "ironingot.png"
-        assert standardize_filename("Boat (Oak)") == "boat_oak.png"
-
-    def test_load_item_image_nonexistent(self):
-        """Test loading image that doesn't exist."""
-        cache = {}
-        img = load_item_image("Nonexistent Item", "/nonexistent/path", cache)
-        assert img is None
-        assert "Nonexistent Item" in cache
-        assert cache["Nonexistent Item"] is None
-
-    def test_load_item_image_cache(self):
-        """Test that image cache is used."""
-        import numpy as np
-
-        cache = {}
-        fake_img = np.array([[[255, 0, 0]]])  # Fake image
-
-        # Pre-populate cache
-        cache["Iron Ingot"] = fake_img
-
-        # Should return cached image without trying to load from disk
-        img = load_item_image("Iron Ingot", "/nonexistent/path", cache)
-        assert img is not None
-        assert np.array_equal(img, fake_img)
-
-    def test_load_item_image_real_file(self):
-        """Test loading a real image file."""
-        import numpy as np
-        from PIL import Image
-
-        # Create a temporary image file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a simple test image
-            test_img = Image.new('RGB', (10, 10), color=(255, 0, 0))
-            img_path = Path(tmpdir) / "iron_ingot.png"
-            test_img.save(img_path)
-
-            # Test loading
-            cache = {}
-            img = load_item_image("Iron Ingot", tmpdir, cache)
-
-            assert img is not None
-            assert isinstance(img, np.ndarray)
-            assert "Iron Ingot" in cache
-            assert cache["Iron Ingot"] is not None
-
-    def test_render_with_images_enabled(self):
-        """Test rendering with image mode enabled but no images available."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        graph = nx.DiGraph()
-        graph.add_node('Item1', node_type='item')
-        graph.add_node('Item2', node_type='item')
-        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
-
-        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
-        node_sizes = {'Item1': 50, 'Item2': 50}
-        edge_colors = ['#4A90E2']
-        color_config = {'crafting': '#4A90E2'}
-
-        # Render with images enabled but no images directory
-        render_3d_graph(
-            graph, pos, node_sizes, edge_colors, color_config,
-            use_images=True,
-            images_dir="/nonexistent/path"
-        )
-
-        fig = plt.gcf()
-        plt.close(fig)
-
-    def test_render_with_images_disabled(self):
-        """Test rendering with image mode disabled (default behavior)."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        graph = nx.DiGraph()
-        graph.add_node('Item1', node_type='item')
-        graph.add_node('Item2', node_type='item')
-        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
-
-        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
-        node_sizes = {'Item1': 50, 'Item2': 50}
-        edge_colors = ['#4A90E2']
-        color_config = {'crafting': '#4A90E2'}
-
-        # Render without images (default)
-        render_3d_graph(
-            graph, pos, node_sizes, edge_colors, color_config,
-            use_images=False
+        csv_content = _make_csv(
+            ("crafting", ["Oak Planks"], ["Stick"]),
+            ("crafting", ["Stick", "Iron Ingot"], ["Iron Sword"]),
+            ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+            ("crafting", ["Oak Planks"], ["Crafting Table"]),
         )
+        # Written to disk to exercise the path-based loading branch
+        csv_path = tmp_path / "transformations.csv"
+        csv_path.write_text(csv_content)
 
-        fig = plt.gcf()
-        plt.close(fig)
-
-    def test_render_image_updates_on_zoom(self):
-        """Test that zoom event handlers are connected when images are enabled."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-        from PIL import Image
-        import tempfile
+        # Build graph
+        graph = build_graph_from_csv(str(csv_path), default_color_config)
 
-        # Create a temporary image file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a simple test image
-            test_img = Image.new('RGB', (10, 10), color=(255, 0, 0))
-            img_path = Path(tmpdir) / "item1.png"
-            test_img.save(img_path)
-
-            graph = nx.DiGraph()
-            graph.add_node('Item1', node_type='item')
-            graph.add_node('Item2', node_type='item')
-            graph.add_edge('Item1', 'Item2', transformation_type='crafting')
-
-            pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
-            node_sizes = {'Item1': 50, 'Item2': 50}
-            edge_colors = ['#4A90E2']
-            color_config = {'crafting': '#4A90E2'}
+        # Compute layout
+        pos = compute_3d_layout(graph)
 
-            # Render with images enabled
-            render_3d_graph(
-                graph, pos, node_sizes, edge_colors, color_config,
-                use_images=True,
-                images_dir=tmpdir
-            )
+        # Calculate sizes
+        sizes = calculate_node_sizes(graph, pos)
 
-            fig = plt.gcf()
+        # Get colors
+        colors = get_edge_colors(graph, default_color_config)
 
-            # Verify button_release_event handler is connected
-            callbacks = fig.canvas.callbacks.callbacks.get('button_release_event', {})
-            assert len(callbacks) > 0, "No button_release_event handler connected for zoom updates"
+        # Verify results
+        assert graph.number_of_nodes() > 0
+        assert graph.number_of_edges() > 0
+        assert len(pos) == graph.number_of_nodes()
+        assert len(sizes) == graph.number_of_nodes()
+        assert len(colors) == graph.number_of_edges()
 
-            # Verify draw_event handler is still connected (for rotation/pan)
-            draw_callbacks = fig.canvas.callbacks.callbacks.get('draw_event', {})
-            assert len(draw_callbacks) > 0, "No draw_event handler connected"
+        # Find intermediate nodes
+        intermediate_nodes = [
+            n for n in graph.nodes()
+            if graph.nodes[n].get('node_type') == 'intermediate'
+        ]
+        assert len(intermediate_nodes) == 1  # One multi-input transformation
 
-            plt.close(fig)
+        # Verify intermediate node has smaller size
+        for inter in intermediate_nodes:
+            assert sizes[inter] == 15
 
 
 class TestLoadTransformationTypes:
@@ -978,40 +692,35 @@ class TestLoadTransformationTypes:
 
     def test_load_types_from_valid_csv(self):
         """Test loading transformation types from valid CSV."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-crafting,"[""Stick""]","[""Tool""]","{}"
-brewing,"[""Water Bottle""]","[""Potion""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            types = load_transformation_types(temp_path)
-            assert len(types) == 3  # crafting, smelting, brewing (unique)
-            assert 'crafting' in types
-            assert 'smelting' in types
-            assert 'brewing' in types
-            # Verify sorted order
-            assert types == sorted(types)
-        finally:
-            Path(temp_path).unlink()
+        types = load_transformation_types(io.StringIO(MIXED_TYPES_CSV))
+        assert len(types) == 3  # crafting, smelting, brewing (unique)
+        assert 'crafting' in types
+        assert 'smelting' in types
+        assert 'brewing' in types
+        # Verify sorted order
+        assert types == sorted(types)
 
     def test_load_types_from_empty_csv(self):
         """Test loading types from empty CSV."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            types = load_transformation_types(temp_path)
-            assert len(types) == 0
-        finally:
-            Path(temp_path).unlink()
+        types = load_transformation_types(io.StringIO(_make_csv()))
+        assert len(types) == 0
+
+    def test_load_types_cached_until_file_changes(self, tmp_path):
+        """Test that types are read once per file version."""
+        csv_path = tmp_path / "transformations.csv"
+        csv_path.write_text(SINGLE_CRAFTING_CSV)
+
+        with patch('src.visualize_graph_3d.csv.reader', wraps=csv.reader) as reader:
+            assert load_transformation_types(str(csv_path)) == ['crafting']
+            assert load_transformation_types(str(csv_path)) == ['crafting']
+            assert reader.call_count == 1
+
+            csv_path.write_text(THREE_TYPES_CSV)
+            stat = csv_path.stat()
+            os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert load_transformation_types(str(csv_path)) == ['brewing', 'crafting', 'smelting']
+            assert reader.call_count == 2
 
     def test_load_types_from_nonexistent_file(self):
         """Test loading types from nonexistent file."""
@@ -1024,87 +733,84 @@ class TestTransformationFiltering:
 
     def test_load_with_filter(self):
         """Test loading transformations with type filter."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-crafting,"[""Stick""]","[""Tool""]","{}"
-brewing,"[""Water Bottle""]","[""Potion""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            # Filter for only crafting
-            transformations = load_transformations_from_csv(temp_path, filter_types=['crafting'])
-            assert len(transformations) == 2
-            assert all(t['transformation_type'] == 'crafting' for t in transformations)
-
-            # Filter for smelting and brewing
-            transformations = load_transformations_from_csv(temp_path, filter_types=['smelting', 'brewing'])
-            assert len(transformations) == 2
-            types = [t['transformation_type'] for t in transformations]
-            assert 'smelting' in types
-            assert 'brewing' in types
-            assert 'crafting' not in types
-        finally:
-            Path(temp_path).unlink()
+        # Filter for only crafting
+        transformations = load_transformations_from_csv(io.StringIO(MIXED_TYPES_CSV), filter_types=['crafting'])
+        assert len(transformations) == 2
+        assert all(t['transformation_type'] == 'crafting' for t in transformations)
+        # JSON columns are decoded into lists of item names
+        assert all(isinstance(item, str) for t in transformations for item in t['input_items'])
+        assert all(isinstance(t['input_items'], list) for t in transformations)
+
+        # Filter for smelting and brewing
+        transformations = load_transformations_from_csv(
+            io.StringIO(MIXED_TYPES_CSV), filter_types=['smelting', 'brewing']
+        )
+        assert len(transformations) == 2
+        types = [t['transformation_type'] for t in transformations]
+        assert 'smelting' in types
+        assert 'brewing' in types
+        assert 'crafting' not in types
 
     def test_load_without_filter(self):
         """Test loading transformations without filter (all types)."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-brewing,"[""Water Bottle""]","[""Potion""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            transformations = load_transformations_from_csv(temp_path, filter_types=None)
-            assert len(transformations) == 3
-        finally:
-            Path(temp_path).unlink()
+        transformations = load_transformations_from_csv(io.StringIO(THREE_TYPES_CSV), filter_types=None)
+        assert len(transformations) == 3
+
+    def test_iter_with_filter_streams_matching_rows(self):
+        """Test that the streaming loader yields only matching rows, one at a time."""
+        rows = iter_transformations_from_csv(io.StringIO(MIXED_TYPES_CSV), filter_types=['smelting'])
+        assert next(rows)['input_items'] == ['Iron Ore']
+        assert next(rows, None) is None
 
     def test_build_graph_with_filter(self):
         """Test building graph with type filtering."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-crafting,"[""Stick""]","[""Tool""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        csv_source = io.StringIO(_make_csv(
+            ("crafting", ["Oak Planks"], ["Stick"]),
+            ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+            ("crafting", ["Stick"], ["Tool"]),
+        ))
+
+        color_config = {'crafting': '#4A90E2', 'smelting': '#E67E22'}
+
+        # Build graph with only crafting transformations
+        graph = build_graph_from_csv(csv_source, color_config, filter_types=['crafting'])
+
+        # Should have 3 item nodes: Oak Planks, Stick, Tool
+        # And 2 edges for the two crafting transformations
+        assert graph.number_of_nodes() == 3
+        assert graph.number_of_edges() == 2
+
+        # Verify no smelting items
+        assert not graph.has_node('Iron Ore')
+        assert not graph.has_node('Iron Ingot')
+
+
+class StubFzf:
+    """Stand-in for FzfPrompt that records its calls and returns canned selections."""
 
-        try:
-            color_config = {'crafting': '#4A90E2', 'smelting': '#E67E22'}
+    def __init__(self, selections=None):
+        self.selections = selections if selections is not None else []
+        self.calls = []
 
-            # Build graph with only crafting transformations
-            graph = build_graph_from_csv(temp_path, color_config, filter_types=['crafting'])
+    def prompt(self, choices, fzf_options=""):
+        self.calls.append((choices, fzf_options))
+        return self.selections
 
-            # Should have 3 item nodes: Oak Planks, Stick, Tool
-            # And 2 edges for the two crafting transformations
-            assert graph.number_of_nodes() == 3
-            assert graph.number_of_edges() == 2
 
-            # Verify no smelting items
-            assert not graph.has_node('Iron Ore')
-            assert not graph.has_node('Iron Ingot')
-        finally:
-            Path(temp_path).unlink()
+@pytest.fixture
+def fzf(monkeypatch):
+    """Stub fzf prompt returned by every FzfPrompt() call in the module under test."""
+    stub = StubFzf()
+    monkeypatch.setattr('src.visualize_graph_3d.FzfPrompt', lambda: stub)
+    return stub
 
 
 class TestInteractiveOptions:
     """Test cases for interactive option collection."""
 
-    @patch('src.visualize_graph_3d.FzfPrompt')
-    def test_prompt_boolean_options_with_selections(self, mock_fzf_class):
+    def test_prompt_boolean_options_with_selections(self, fzf):
         """Test prompting for boolean options with user selections."""
-        mock_fzf = Mock()
-        mock_fzf_class.return_value = mock_fzf
-        mock_fzf.prompt.return_value = [
+        fzf.selections = [
             "use-images: Use item images instead of spheres",
             "verbose: Enable verbose logging"
         ]
@@ -1114,77 +820,48 @@ class TestInteractiveOptions:
         assert result['use_images'] is True
         assert result['verbose'] is True
 
-    @patch('src.visualize_graph_3d.FzfPrompt')
-    def test_prompt_boolean_options_no_selections(self, mock_fzf_class):
+    def test_prompt_boolean_options_no_selections(self, fzf):
         """Test prompting for boolean options with no selections."""
-        mock_fzf = Mock()
-        mock_fzf_class.return_value = mock_fzf
-        mock_fzf.prompt.return_value = []
+        fzf.selections = []
 
         result = prompt_boolean_options()
 
         assert result['use_images'] is False
         assert result['verbose'] is False
 
-    @patch('src.visualize_graph_3d.FzfPrompt')
-    def test_prompt_boolean_options_partial_selections(self, mock_fzf_class):
+    def test_prompt_boolean_options_partial_selections(self, fzf):
         """Test prompting for boolean options with partial selections."""
-        mock_fzf = Mock()
-        mock_fzf_class.return_value = mock_fzf
-        mock_fzf.prompt.return_value = ["verbose: Enable verbose logging"]
+        fzf.selections = ["verbose: Enable verbose logging"]
 
         result = prompt_boolean_options()
 
         assert result['use_images'] is False
         assert result['verbose'] is True
 
-    @patch('src.visualize_graph_3d.FzfPrompt')
-    def test_prompt_transformation_types_with_selections(self, mock_fzf_class):
+    def test_prompt_transformation_types_with_selections(self, fzf, three_types_csv):
         """Test prompting for transformation types with selections."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-brewing,"[""Water Bottle""]","[""Potion""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            mock_fzf = Mock()
-            mock_fzf_class.return_value = mock_fzf
-            mock_fzf.prompt.return_value = ["crafting", "smelting"]
+        fzf.selections = ["crafting", "smelting"]
 
-            result = prompt_transformation_types(temp_path)
+        result = prompt_transformation_types(three_types_csv)
 
-            assert result == ["crafting", "smelting"]
-        finally:
-            Path(temp_path).unlink()
+        assert result == ["crafting", "smelting"]
 
-    @patch('src.visualize_graph_3d.FzfPrompt')
-    def test_prompt_transformation_types_all_selected(self, mock_fzf_class):
+    def test_prompt_transformation_types_all_selected(self, fzf, tmp_path):
         """Test prompting for transformation types with 'All types' selected."""
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        csv_content = _make_csv(
+            ("crafting", ["Oak Planks"], ["Stick"]),
+            ("smelting", ["Iron Ore"], ["Iron Ingot"]),
+        )
+        csv_path = tmp_path / "transformations.csv"
+        csv_path.write_text(csv_content)
 
-        try:
-            mock_fzf = Mock()
-            mock_fzf_class.return_value = mock_fzf
-            mock_fzf.prompt.return_value = ["[All types - no filtering]"]
+        fzf.selections = ["[All types - no filtering]"]
 
-            result = prompt_transformation_types(temp_path)
+        result = prompt_transformation_types(str(csv_path))
 
-            assert result is None
-        finally:
-            Path(temp_path).unlink()
+        assert result is None
 
-    @patch('src.visualize_graph_3d.FzfPrompt')
-    def test_collect_options_no_interactive(self, mock_fzf_class):
+    def test_collect_options_no_interactive(self, fzf, single_crafting_csv):
         """Test collect_options with --no-interactive flag."""
         args = Namespace(
             use_images=False,
@@ -1193,27 +870,16 @@ smelting,"[""Iron Ore""]","[""Iron Ingot""]","{}"
             no_interactive=True
         )
 
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            result = collect_options(args, temp_path)
+        result = collect_options(args, single_crafting_csv)
 
-            # FZF should not be called at all
-            mock_fzf_class.assert_not_called()
+        # FZF should not be called at all
+        assert fzf.calls == []
 
-            assert result['use_images'] is False
-            assert result['verbose'] is False
-            assert result['filter_types'] is None
-        finally:
-            Path(temp_path).unlink()
+        assert result['use_images'] is False
+        assert result['verbose'] is False
+        assert result['filter_types'] is None
 
-    @patch('src.visualize_graph_3d.FzfPrompt')
-    def test_collect_options_with_cli_args(self, mock_fzf_class):
+    def test_collect_options_with_cli_args(self, fzf, single_crafting_csv):
         """Test collect_options with CLI args provided (should skip prompts)."""
         args = Namespace(
             use_images=True,
@@ -1222,28 +888,18 @@ crafting,"[""Oak Planks""]","[""Stick""]","{}"
             no_interactive=False
         )
 
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            result = collect_options(args, temp_path)
+        result = collect_options(args, single_crafting_csv)
 
-            # FZF should not be called since all args are provided
-            mock_fzf_class.assert_not_called()
+        # FZF should not be called since all args are provided
+        assert fzf.calls == []
 
-            assert result['use_images'] is True
-            assert result['verbose'] is True
-            assert result['filter_types'] == ['crafting', 'smelting']
-        finally:
-            Path(temp_path).unlink()
+        assert result['use_images'] is True
+        assert result['verbose'] is True
+        assert result['filter_types'] == frozenset({'crafting', 'smelting'})
 
     @patch('src.visualize_graph_3d.prompt_transformation_types')
     @patch('src.visualize_graph_3d.prompt_boolean_options')
-    def test_collect_options_interactive_mode(self, mock_bool_prompt, mock_type_prompt):
+    def test_collect_options_interactive_mode(self, mock_bool_prompt, mock_type_prompt, single_crafting_csv):
         """Test collect_options in interactive mode."""
         args = Namespace(
             use_images=False,
@@ -1255,28 +911,18 @@ crafting,"[""Oak Planks""]","[""Stick""]","{}"
         mock_bool_prompt.return_value = {'use_images': True, 'verbose': False}
         mock_type_prompt.return_value = ['crafting']
 
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        result = collect_options(args, single_crafting_csv)
 
-        try:
-            result = collect_options(args, temp_path)
+        # Both prompts should be called
+        mock_bool_prompt.assert_called_once()
+        mock_type_prompt.assert_called_once_with(single_crafting_csv)
 
-            # Both prompts should be called
-            mock_bool_prompt.assert_called_once()
-            mock_type_prompt.assert_called_once_with(temp_path)
-
-            assert result['use_images'] is True
-            assert result['verbose'] is False
-            assert result['filter_types'] == ['crafting']
-        finally:
-            Path(temp_path).unlink()
+        assert result['use_images'] is True
+        assert result['verbose'] is False
+        assert result['filter_types'] == ['crafting']
 
     @patch('src.visualize_graph_3d.prompt_transformation_types')
-    def test_collect_options_partial_cli_args(self, mock_type_prompt):
+    def test_collect_options_partial_cli_args(self, mock_type_prompt, single_crafting_csv):
         """Test collect_options with partial CLI args (some prompting needed)."""
         args = Namespace(
             use_images=True,  # Provided
@@ -1287,21 +933,28 @@ crafting,"[""Oak Planks""]","[""Stick""]","{}"
 
         mock_type_prompt.return_value = ['smelting']
 
-        csv_content = """transformation_type,input_items,output_items,metadata
-crafting,"[""Oak Planks""]","[""Stick""]","{}"
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        result = collect_options(args, single_crafting_csv)
 
-        try:
-            result = collect_options(args, temp_path)
+        # Type prompt should be called, but not boolean prompt (use_images was set)
+        mock_type_prompt.assert_called_once_with(single_crafting_csv)
+
+        assert result['use_images'] is True
+        assert result['verbose'] is False
+        assert result['filter_types'] == ['smelting']
 
-            # Type prompt should be called, but not boolean prompt (use_images was set)
-            mock_type_prompt.assert_called_once_with(temp_path)
 
-            assert result['use_images'] is True
-            assert result['verbose'] is False
-            assert result['filter_types'] == ['smelting']
-        finally:
-            Path(temp_path).unlink()
+class TestModuleImport:
+    """Tests for the import cost of the module."""
+
+    def test_import_time(self):
+        """Test that importing the module does not pull in matplotlib or Pillow."""
+        code = (
+            "import sys, src.visualize_graph_3d; "
+            "print(','.join(m for m in ('matplotlib', 'PIL') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
@@ -0,0 +1,458 @@
+"""Rendering and image tests for the 3D graph visualization module.
+
+Kept apart from test_visualize_graph_3d.py so that the CSV, builder and layout
+tests can run without importing matplotlib.
+"""
+
+from unittest.mock import ANY, patch
+
+import networkx as nx
+import pytest
+
+from src.visualize_graph_3d import (
+    DiskIconCache,
+    ImageCache,
+    load_item_image,
+    preload_item_images,
+    render_3d_graph,
+    standardize_filename,
+)
+
+plt = pytest.importorskip("matplotlib.pyplot")
+
+pytestmark = pytest.mark.usefixtures("matplotlib_agg")
+
+
+class TestRender3DGraph:
+    """Test cases for 3D graph rendering with hover annotations."""
+
+    @patch('src.visualize_graph_3d.plt')
+    def test_render_creates_event_handler(self, mock_plt):
+        """Test that render_3d_graph creates and connects hover event handler."""
+        # Create simple graph
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
+        node_sizes = {'Item1': 50, 'Item2': 50}
+        edge_colors = ['#4A90E2']
+        color_config = {'crafting': '#4A90E2'}
+
+        # Render graph
+        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
+
+        # Check that motion_notify_event handler is connected
+        fig = mock_plt.figure.return_value
+        fig.canvas.mpl_connect.assert_any_call('motion_notify_event', ANY)
+
+    @patch('src.visualize_graph_3d.plt')
+    def test_render_with_empty_graph(self, mock_plt):
+        """Test rendering with empty graph doesn't crash."""
+        graph = nx.DiGraph()
+        pos = {}
+        node_sizes = {}
+        edge_colors = []
+        color_config = {}
+
+        # Should not raise any errors
+        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
+
+        # Nothing to draw
+        ax = mock_plt.figure.return_value.add_subplot.return_value
+        ax.quiver.assert_not_called()
+        ax.scatter.assert_not_called()
+
+    @patch('src.visualize_graph_3d.plt')
+    def test_render_with_only_item_nodes(self, mock_plt):
+        """Test rendering with only item nodes (no intermediate nodes)."""
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
+        node_sizes = {'Item1': 50, 'Item2': 50}
+        edge_colors = ['#4A90E2']
+        color_config = {'crafting': '#4A90E2'}
+
+        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
+
+        ax = mock_plt.figure.return_value.add_subplot.return_value
+
+        # Only the item scatter is drawn (no intermediate scatter)
+        assert ax.scatter.call_count == 1
+
+        # Check that axis ticks are not removed (numeric scales enabled)
+        ax.set_xticks.assert_not_called()
+        ax.set_yticks.assert_not_called()
+        ax.set_zticks.assert_not_called()
+
+    def test_render_with_intermediate_nodes(self):
+        """Test rendering with both item and intermediate nodes."""
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_node('intermediate_0', node_type='intermediate')
+        graph.add_node('Item3', node_type='item')
+        graph.add_edge('Item1', 'intermediate_0', transformation_type='crafting')
+        graph.add_edge('Item2', 'intermediate_0', transformation_type='crafting')
+        graph.add_edge('intermediate_0', 'Item3', transformation_type='crafting')
+
+        pos = {
+            'Item1': (0, 0, 0),
+            'Item2': (1, 0, 0),
+            'intermediate_0': (0.5, 0.5, 0.5),
+            'Item3': (0.5, 1, 1)
+        }
+        node_sizes = {'Item1': 50, 'Item2': 50, 'intermediate_0': 15, 'Item3': 50}
+        edge_colors = ['#4A90E2', '#4A90E2', '#4A90E2']
+        color_config = {'crafting': '#4A90E2'}
+
+        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
+
+        fig = plt.gcf()
+        plt.close(fig)
+
+    @pytest.mark.slow
+    @patch('src.visualize_graph_3d.plt')
+    def test_render_with_large_graph(self, mock_plt):
+        """Test rendering performance with larger graph (simulating real use case)."""
+        # Create graph with 100 nodes and edges between sequential nodes
+        names = [f'Item{i}' for i in range(100)]
+        graph = nx.DiGraph()
+        graph.add_nodes_from(names, node_type='item')
+        graph.add_edges_from(zip(names, names[1:]), transformation_type='crafting')
+
+        # Create positions and sizes
+        pos = dict(zip(names, ((i % 10, i // 10, i % 5) for i in range(100))))
+        node_sizes = dict.fromkeys(names, 50)
+        edge_colors = ['#4A90E2'] * 99
+        color_config = {'crafting': '#4A90E2'}
+
+        # Should handle large graph without errors
+        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
+
+        # One arrow per edge
+        fig = mock_plt.figure.return_value
+        assert fig.add_subplot.return_value.quiver.call_count == 99
+
+        # Verify event handler is still connected
+        fig.canvas.mpl_connect.assert_any_call('motion_notify_event', ANY)
+
+    def test_axis_scales_enabled(self):
+        """Test that numeric axis scales are enabled (ticks not removed)."""
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
+        node_sizes = {'Item1': 50, 'Item2': 50}
+        edge_colors = ['#4A90E2']
+        color_config = {'crafting': '#4A90E2'}
+
+        render_3d_graph(graph, pos, node_sizes, edge_colors, color_config)
+
+        fig = plt.gcf()
+        ax = fig.axes[0]
+
+        # Check that ticks exist (not explicitly set to empty)
+        # Matplotlib auto-generates ticks when not explicitly set to []
+        x_ticks = ax.get_xticks()
+        y_ticks = ax.get_yticks()
+        z_ticks = ax.get_zticks()
+
+        # Verify ticks are present (may be auto-generated)
+        assert x_ticks is not None
+        assert y_ticks is not None
+        assert z_ticks is not None
+
+        plt.close(fig)
+
+
+class TestImageFunctionality:
+    """Test cases for image loading and rendering functionality."""
+
+    def test_standardize_filename_basic(self):
+        """Test basic filename standardization."""
+        assert standardize_filename("Iron Ingot") == "iron_ingot.png"
+        assert standardize_filename("Oak Planks") == "oak_planks.png"
+
+    def test_standardize_filename_special_chars(self):
+        """Test filename standardization with special characters."""
+        assert standardize_filename("Iron-Ingot!") == "ironingot.png"
+        assert standardize_filename("Boat (Oak)") == "boat_oak.png"
+
+    def test_standardize_filename_memoized(self):
+        """Test that repeated names are served from the cache."""
+        standardize_filename.cache_clear()
+        assert standardize_filename("Iron Ingot") == standardize_filename("Iron Ingot")
+        assert standardize_filename.cache_info().hits == 1
+
+    def test_load_item_image_nonexistent(self):
+        """Test loading image that doesn't exist."""
+        cache = ImageCache()
+        img = load_item_image("Nonexistent Item", "/nonexistent/path", cache)
+        assert img is None
+        assert "Nonexistent Item" in cache
+        assert cache["Nonexistent Item"] is None
+
+    def test_bulk_scan_called_once(self, tmp_path):
+        """Test that the images directory is listed once for many lookups."""
+        import os
+
+        cache = ImageCache()
+        with patch("src.visualize_graph_3d.os.scandir", wraps=os.scandir) as scandir:
+            for i in range(100):
+                assert load_item_image(f"Missing Item {i}", str(tmp_path), cache) is None
+        assert scandir.call_count == 1
+
+    def test_load_item_image_cache(self):
+        """Test that image cache is used."""
+        import numpy as np
+
+        cache = ImageCache()
+        fake_img = np.array([[[255, 0, 0]]])  # Fake image
+
+        # Pre-populate cache
+        cache["Iron Ingot"] = fake_img
+
+        # Should return cached image without trying to load from disk
+        img = load_item_image("Iron Ingot", "/nonexistent/path", cache)
+        assert img is not None
+        assert np.array_equal(img, fake_img)
+
+    def test_lru_eviction(self, monkeypatch):
+        """Test that the least recently used image is evicted once over the size limit."""
+        import numpy as np
+
+        monkeypatch.delenv("DISABLE_LRU_CACHE", raising=False)
+        icon = np.zeros((4, 4, 4), dtype=np.uint8)
+        cache = ImageCache(max_bytes=3 * icon.nbytes)
+        for i in range(3):
+            cache[f"Item {i}"] = icon.copy()
+
+        # Touch Item 0 so Item 1 becomes the least recently used entry
+        assert cache.get("Item 0") is not None
+        cache["Item 3"] = icon.copy()
+
+        assert "Item 1" not in cache
+        assert all(f"Item {i}" in cache for i in (0, 2, 3))
+        assert cache.total_bytes == 3 * icon.nbytes
+
+    def test_load_item_image_real_file(self, tmp_path):
+        """Test loading a real image file."""
+        import numpy as np
+        from PIL import Image
+
+        # Create a simple test image
+        test_img = Image.new('RGB', (10, 10), color=(255, 0, 0))
+        img_path = tmp_path / "iron_ingot.png"
+        test_img.save(img_path)
+
+        # Test loading
+        cache = {}
+        img = load_item_image("Iron Ingot", str(tmp_path), cache)
+
+        assert img is not None
+        assert isinstance(img, np.ndarray)
+        assert img.dtype == np.uint8
+        assert img.shape == (10, 10, 4)
+        assert "Iron Ingot" in cache
+        assert cache["Iron Ingot"] is not None
+
+    def test_preload_item_images(self, tmp_path):
+        """Test that preloading fills the cache for items with and without images."""
+        import numpy as np
+        from PIL import Image
+
+        names = [f"Item {i}" for i in range(50)]
+        test_img = Image.new('RGB', (10, 10), color=(255, 0, 0))
+        for name in names:
+            test_img.save(tmp_path / standardize_filename(name))
+
+        cache = {}
+        preload_item_images(names + ["Missing Item"], str(tmp_path), cache)
+
+        assert all(isinstance(cache[name], np.ndarray) for name in names)
+        assert cache["Missing Item"] is None
+
+    def test_disk_icon_cache_skips_decode_on_next_run(self, tmp_path):
+        """Test that icons saved by one run are restored without decoding by the next."""
+        import numpy as np
+        from PIL import Image
+
+        images_dir = tmp_path / "images"
+        images_dir.mkdir()
+        Image.new('RGB', (10, 10), color=(255, 0, 0)).save(images_dir / "iron_ingot.png")
+        cache_path = tmp_path / "cache" / "icons.npz"
+
+        first_run = DiskIconCache(str(images_dir), cache_path)
+        assert first_run.preload(["Iron Ingot"]) == 0
+        img = load_item_image("Iron Ingot", str(images_dir), first_run)
+        assert first_run.save()
+
+        second_run = DiskIconCache(str(images_dir), cache_path)
+        with patch('src.visualize_graph_3d._read_image') as read_image:
+            assert second_run.preload(["Iron Ingot"]) == 1
+            restored = load_item_image("Iron Ingot", str(images_dir), second_run)
+            read_image.assert_not_called()
+
+        assert np.array_equal(restored, img)
+        # Nothing new was decoded, so the file is left alone
+        assert not second_run.save()
+
+    def test_render_with_images_enabled(self):
+        """Test rendering with image mode enabled but no images available."""
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
+        node_sizes = {'Item1': 50, 'Item2': 50}
+        edge_colors = ['#4A90E2']
+        color_config = {'crafting': '#4A90E2'}
+
+        # Render with images enabled but no images directory
+        render_3d_graph(
+            graph, pos, node_sizes, edge_colors, color_config,
+            use_images=True,
+            images_dir="/nonexistent/path"
+        )
+
+        fig = plt.gcf()
+        plt.close(fig)
+
+    def test_prefetch_warms_cache(self, tmp_path):
+        """Test that every icon is decoded before the first scatter call."""
+        from PIL import Image
+        from mpl_toolkits.mplot3d.axes3d import Axes3D
+
+        import src.visualize_graph_3d as visualize_graph_3d
+
+        Image.new('RGB', (10, 10), color=(255, 0, 0)).save(tmp_path / "item1.png")
+
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
+        node_sizes = {'Item1': 50, 'Item2': 50}
+
+        events = []
+        read_image = visualize_graph_3d._read_image
+
+        def record_read(image_path):
+            events.append('read')
+            return read_image(image_path)
+
+        with patch.object(visualize_graph_3d, '_read_image', side_effect=record_read), \
+                patch.object(Axes3D, 'scatter', autospec=True,
+                             side_effect=lambda *args, **kwargs: events.append('scatter')):
+            render_3d_graph(
+                graph, pos, node_sizes, ['#4A90E2'], {'crafting': '#4A90E2'},
+                use_images=True,
+                images_dir=str(tmp_path)
+            )
+
+        plt.close(plt.gcf())
+
+        # Item2 has no icon and is drawn with the fallback scatter
+        first_scatter = events.index('scatter')
+        assert events[:first_scatter] == ['read']
+        assert 'read' not in events[first_scatter:]
+
+    def test_render_with_images_disabled(self):
+        """Test rendering with image mode disabled (default behavior)."""
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
+        node_sizes = {'Item1': 50, 'Item2': 50}
+        edge_colors = ['#4A90E2']
+        color_config = {'crafting': '#4A90E2'}
+
+        # Render without images (default)
+        render_3d_graph(
+            graph, pos, node_sizes, edge_colors, color_config,
+            use_images=False
+        )
+
+        fig = plt.gcf()
+        plt.close(fig)
+
+    def test_render_image_updates_on_zoom(self, tmp_path):
+        """Test that zoom event handlers are connected when images are enabled."""
+        from PIL import Image
+
+        # Create a simple test image
+        test_img = Image.new('RGB', (10, 10), color=(255, 0, 0))
+        img_path = tmp_path / "item1.png"
+        test_img.save(img_path)
+
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        pos = {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}
+        node_sizes = {'Item1': 50, 'Item2': 50}
+        edge_colors = ['#4A90E2']
+        color_config = {'crafting': '#4A90E2'}
+
+        # Render with images enabled
+        render_3d_graph(
+            graph, pos, node_sizes, edge_colors, color_config,
+            use_images=True,
+            images_dir=str(tmp_path)
+        )
+
+        fig = plt.gcf()
+
+        callbacks = fig.canvas.callbacks.callbacks
+
+        # Verify button_release_event handler is connected
+        assert callbacks.get('button_release_event'), "No button_release_event handler connected for zoom updates"
+
+        # Verify draw_event handler is still connected (for rotation/pan)
+        assert callbacks.get('draw_event'), "No draw_event handler connected"
+
+        plt.close(fig)
+
+    def test_zoom_debounce_coalesces(self, tmp_path):
+        """Test that a burst of button releases triggers a single redraw."""
+        from matplotlib.backend_bases import MouseEvent
+        from PIL import Image
+
+        Image.new('RGB', (10, 10), color=(255, 0, 0)).save(tmp_path / "item1.png")
+
+        graph = nx.DiGraph()
+        graph.add_node('Item1', node_type='item')
+        graph.add_node('Item2', node_type='item')
+        graph.add_edge('Item1', 'Item2', transformation_type='crafting')
+
+        render_3d_graph(
+            graph, {'Item1': (0, 0, 0), 'Item2': (1, 1, 1)}, {'Item1': 50, 'Item2': 50},
+            ['#4A90E2'], {'crafting': '#4A90E2'},
+            use_images=True,
+            images_dir=str(tmp_path)
+        )
+        fig = plt.gcf()
+
+        with patch.object(fig.canvas, 'draw_idle') as draw_idle:
+            for _ in range(10):
+                event = MouseEvent('button_release_event', fig.canvas, 0, 0, button=1)
+                fig.canvas.callbacks.process('button_release_event', event)
+
+            # Nothing is redrawn until the debounce timer fires, then only once
+            draw_idle.assert_not_called()
+            fig._refresh_timer._on_timer()
+            draw_idle.assert_called_once()
+
+        plt.close(fig)